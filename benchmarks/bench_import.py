@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Track the cold ``import imow.api`` cost against a budget.
+
+Runs ``python -X importtime -c "import imow.api"`` in fresh interpreters, takes
+the fastest run and reports the cumulative import time of ``imow.api``, the
+share spent in ``aiohttp`` (unavoidable for the client) and the slowest direct
+imports. Exits non-zero if the total exceeds ``--budget-ms`` or if a module
+that should only load on first use (login or i18n) was imported eagerly.
+
+Usage: ``uv run python benchmarks/bench_import.py [--budget-ms 400] [--runs 5]``
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Modules only needed during login or i18n loading; importing ``imow.api`` must
+# not pull them in.
+LAZY_MODULES = ("furl", "imow.common.messages", "imow.common.loginform")
+
+
+def import_times() -> Dict[str, Tuple[int, int, int]]:
+    """Return ``{module: (self_us, cumulative_us, depth)}`` for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import imow.api"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times["imow.api"][1])
+    total_ms = best["imow.api"][1] / 1000
+    aiohttp_ms = best.get("aiohttp", (0, 0, 0))[1] / 1000
+
+    print(f"import imow.api: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"  of which aiohttp: {aiohttp_ms:.1f} ms")
+    direct = sorted(
+        (
+            (cumulative, name)
+            for name, (_, cumulative, depth) in best.items()
+            if depth == 1
+        ),
+        reverse=True,
+    )
+    for cumulative, name in direct[:8]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print("FAIL: over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
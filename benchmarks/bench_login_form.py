@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark csrf-token/requestId extraction from the STIHL login page.
+
+Compares the streaming :func:`imow.common.loginform.extract_login_form` with
+the full BeautifulSoup parse it replaced (skipped if ``bs4`` is not installed)
+on a synthetic page shaped like the real login page: a large ``<head>``, the
+form in the middle of the body and a long footer after it.
+
+Usage: ``uv run python benchmarks/bench_login_form.py``
+"""
+
+import timeit
+import tracemalloc
+
+from imow.common.loginform import extract_login_form
+
+
+def realistic_login_page() -> str:
+    head = "".join(
+        f'<link rel="stylesheet" href="/assets/css/bundle-{i}.css">'
+        f'<script src="/assets/js/chunk-{i}.js" defer></script>'
+        for i in range(40)
+    )
+    nav = "".join(
+        f'<li class="nav-item"><a href="/p/{i}">Page {i}</a></li>' for i in range(60)
+    )
+    form = (
+        '<form method="post" action="/authentication/authenticate/">'
+        '<input type="hidden" name="csrf-token" '
+        'value="0123456789abcdef0123456789abcdef">'
+        '<input type="hidden" name="requestId" value="fedcba9876543210">'
+        '<label for="mail">E-Mail</label><input id="mail" name="mail" type="email">'
+        '<label for="password">Password</label>'
+        '<input id="password" name="password" type="password">'
+        '<button type="submit" class="btn btn-primary">Login</button></form>'
+    )
+    footer = "".join(
+        f'<div class="footer-col"><h4>Section {i}</h4><p>{"Lorem ipsum " * 20}</p>'
+        f'<ul>{"<li><a href=#>link</a></li>" * 10}</ul></div>'
+        for i in range(40)
+    )
+    return (
+        '<!DOCTYPE html><html lang="de"><head><meta charset="utf-8">'
+        '<meta name="csrf-token" content="0123456789abcdef0123456789abcdef">'
+        f"{head}</head><body><nav><ul>{nav}</ul></nav><main>{form}</main>"
+        f"<footer>{footer}</footer></body></html>"
+    )
+
+
+def extract_with_beautifulsoup(html: str):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    csrf = soup.find("input", {"name": "csrf-token"})
+    request_id = soup.find("input", {"name": "requestId"})
+    return csrf.get("value"), request_id.get("value")
+
+
+def measure(name: str, func, html: str, number: int = 50) -> None:
+    seconds = min(timeit.repeat(lambda: func(html), number=number, repeat=5)) / number
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<16} {seconds * 1000:8.3f} ms/page  peak {peak / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    html = realistic_login_page()
+    print(f"login page: {len(html) / 1024:.1f} KiB")
+    form = extract_login_form(html)
+    assert form.csrf_token and form.request_id
+    measure("streaming", extract_login_form, html)
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        print("beautifulsoup   (bs4 not installed, skipped)")
+    else:
+        measure("beautifulsoup", extract_with_beautifulsoup, html)
+
+
+if __name__ == "__main__":
+    main()
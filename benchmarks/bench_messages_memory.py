@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Measure the memory a client keeps alive for its i18n message tables.
+
+Builds a synthetic language file shaped like the real one (every
+``viking_mainstate_*``/``message_M*`` key the catalogue resolves plus a few
+thousand unrelated SPA texts), parses it from JSON like a download would, and
+reports with ``tracemalloc`` what stays resident per client:
+
+* ``full dict``: the parsed file kept alive next to the ``Messages`` (what
+  ``Messages`` used to retain via ``self.i18n``), and
+* ``trimmed``: only the ``Messages`` instance, which keeps the texts it
+  resolves.
+
+A client holds two tables (``en`` and its own language), so both are loaded.
+
+Usage: ``uv run python benchmarks/bench_messages_memory.py [--ui-keys 4000]``
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from imow.common.messages import ERROR_MESSAGES, SUCCESS_MESSAGES, Messages
+
+
+def language_file(lang: str, ui_keys: int) -> str:
+    i18n = {}
+    for message in SUCCESS_MESSAGES:
+        i18n[f"viking_mainstate_{message.picture}_short"] = f"{lang} {message.message}"
+        i18n[f"viking_mainstate_{message.picture}_long"] = (
+            f"{lang} {message.message} " * 4
+        )
+    for message in ERROR_MESSAGES:
+        i18n[f"message_M{message.id}_short"] = f"{lang} {message.message}"
+        i18n[f"message_M{message.id}_long"] = f"{lang} {message.message} " * 8
+    for i in range(ui_keys):
+        i18n[f"spa_view_{i // 50}_label_{i}"] = f"{lang} UI text number {i} " * 3
+    return json.dumps(i18n)
+
+
+def resident_bytes(files, keep_full_dict: bool) -> int:
+    """Bytes still allocated after loading ``files`` into ``Messages``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = []
+    for text in files:
+        i18n = json.loads(text)
+        kept.append(Messages(i18n))
+        if keep_full_dict:
+            kept.append(i18n)
+        del i18n
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ui-keys", type=int, default=4000)
+    args = parser.parse_args()
+
+    files = [language_file(lang, args.ui_keys) for lang in ("en", "de")]
+    print(f"language files: {', '.join(f'{len(t) / 1024:.0f} KiB' for t in files)}")
+    full = resident_bytes(files, keep_full_dict=True)
+    trimmed = resident_bytes(files, keep_full_dict=False)
+    print(f"full dict  {full / 1024:8.1f} KiB per client")
+    print(f"trimmed    {trimmed / 1024:8.1f} KiB per client")
+    print(f"saved      {(full - trimmed) / 1024:8.1f} KiB ({full / trimmed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Compare memory and construction time of ``MowerState`` with the old class.
+
+``LegacyMowerState`` below is the previous implementation: every upstream key
+copied into the instance ``__dict__`` and a fresh ``stateMessage`` dict per
+instance. Both classes wrap the same parsed payloads (a full 40-field mower as
+returned by ``/mowers/``); the reported memory is what the wrappers allocate on
+top of the payloads.
+
+Usage: ``uv run python benchmarks/bench_mowerstate.py [--mowers 5000]``
+"""
+
+import argparse
+import gc
+import json
+import logging
+import timeit
+import tracemalloc
+from typing import Optional
+
+from imow.common.exceptions import MessageNotFoundError
+from imow.common.messages import Messages
+from imow.common.mowerstate import (
+    _RESERVED_ATTRIBUTES,
+    _UNKNOWN_MACHINE_STATE,
+    MowerState,
+)
+
+logger = logging.getLogger("imow")
+
+
+class LegacyMowerState:
+    """The previous ``MowerState`` (``__dict__`` based), minus the API methods."""
+
+    ERROR_MAINSTATE_CODE = 1
+
+    def __init__(self, upstream, imow):
+        self.imow = imow
+
+        self.stateMessage = {
+            "short": "",
+            "long": "",
+            "legacyMessage": "",
+            "errorId": "",
+            "error": False,
+        }
+        self.machineError = None
+        self.machineState = None
+        self.replace_state(upstream)
+
+    def replace_state(self, upstream):
+        cleaned = {
+            key.replace(" ", "_"): value
+            for key, value in upstream.items()
+            if key.replace(" ", "_") not in _RESERVED_ATTRIBUTES
+        }
+        self.__dict__.update(cleaned)
+        self.update_state_messages()
+
+    def _get_state_codes(self) -> Optional[tuple[int, bool]]:
+        """Return ``(short_code, is_error)`` from ``status``, or ``None``.
+
+        Returns ``None`` (rather than raising) if the payload lacks a usable
+        ``status`` block, so message resolution degrades gracefully.
+        """
+        status = getattr(self, "status", None)
+        if not isinstance(status, dict) or "mainState" not in status:
+            logger.debug("MowerState has no usable 'status'; skipping messages")
+            return None
+        is_error = status["mainState"] == self.ERROR_MAINSTATE_CODE
+        short_code = status["extraStatus"] if is_error else status["mainState"]
+        return short_code, is_error
+
+    def update_state_messages(self) -> None:
+        codes = self._get_state_codes()
+        if codes is None or self.imow.messages_user is None:
+            if codes is None:
+                logger.debug("MowerState has no usable 'status'; state UNKNOWN")
+            else:
+                logger.debug("i18n messages not loaded yet; skipping state messages")
+            # Still derive a (neutral) machineState so it is never left as None.
+            self.generate_machine_state()
+            return
+        short_code, is_error = codes
+        messages = self.imow.messages_user
+
+        try:
+            if not is_error:
+                (
+                    self.stateMessage["short"],
+                    self.stateMessage["long"],
+                ) = messages.get_status_message(short_code=short_code)
+                self.stateMessage["error"] = False
+                self.machineError = None
+                self.stateMessage["errorId"] = ""
+            else:
+                (
+                    self.stateMessage["short"],
+                    self.stateMessage["long"],
+                    self.stateMessage["errorId"],
+                    self.stateMessage["legacyMessage"],
+                ) = messages.get_error_message(short_code=short_code)
+                self.stateMessage["error"] = True
+                self.machineError = self.stateMessage["errorId"]
+        except MessageNotFoundError as err:
+            logger.warning("Unknown mower state/error code: %s", err)
+        self.generate_machine_state()
+
+    def generate_machine_state(self) -> None:
+        codes = self._get_state_codes()
+        if codes is None or self.imow.messages_en is None:
+            self.machineState = _UNKNOWN_MACHINE_STATE
+            return
+        short_code, is_error = codes
+        messages = self.imow.messages_en
+
+        try:
+            if not is_error:
+                state_msg_short, _ = messages.get_status_message(short_code=short_code)
+            else:
+                (
+                    state_msg_short,
+                    _long,
+                    _error_id,
+                    _legacy,
+                ) = messages.get_error_message(short_code=short_code)
+        except MessageNotFoundError:
+            self.machineState = _UNKNOWN_MACHINE_STATE
+            return
+
+        self.machineState = state_msg_short.upper().replace(" ", "_").replace(".", "")
+
+
+class FakeClient:
+    def __init__(self, messages):
+        self.messages_en = self.messages_user = messages
+
+
+def mower_payload(i: int) -> dict:
+    fields = {name: f"value-{name}" for name in MowerState.FIELDS}
+    fields.update(
+        id=str(30000 + i),
+        name=f"Mower {i}",
+        coordinateLatitude=54.0 + i / 1e4,
+        coordinateLongitude=10.0 + i / 1e4,
+        smartLogic={"mowingGrowthAdjustment": 0, "smartLogicEnabled": True},
+        status={"mainState": 7, "extraStatus": 0, "online": True, "rainStatus": False},
+    )
+    return fields
+
+
+def allocated(cls, payloads, client) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = [cls(payload, client) for payload in payloads]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del states
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mowers", type=int, default=5000)
+    args = parser.parse_args()
+
+    client = FakeClient(
+        Messages(
+            {
+                "viking_mainstate_charge_short": "Charging",
+                "viking_mainstate_charge_long": "Charging at the dock",
+            }
+        )
+    )
+    payloads = [json.loads(json.dumps(mower_payload(i))) for i in range(args.mowers)]
+    payload = payloads[0]
+
+    print(f"{args.mowers} mowers")
+    for name, cls in (("legacy", LegacyMowerState), ("slots", MowerState)):
+        per_object = allocated(cls, payloads, client) / args.mowers
+        seconds = min(timeit.repeat(lambda: cls(payload, client), number=2000)) / 2000
+        print(
+            f"{name:<8} {per_object:8.0f} B/object  "
+            f"{seconds * 1e6:6.2f} us/construction"
+        )
+
+
+if __name__ == "__main__":
+    main()
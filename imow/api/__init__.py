@@ -2,20 +2,36 @@
 
 import asyncio
 import base64
+import contextlib
 import json
 import logging
 import os
 import random
+import time
+from contextvars import ContextVar, copy_context
 from datetime import datetime, timedelta, timezone
-from typing import Any, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote
 
 import aiohttp
 from aiohttp import ClientSession, ClientResponseError, ClientResponse
-from bs4 import BeautifulSoup
-from furl import furl
 
+from imow.api.bulk import BULK_ENDPOINTS, MowerResult
+from imow.api.watch import WatchHub
 from imow.common.actions import IMowActions
+from imow.common.circuitbreaker import CircuitBreaker
 from imow.common.consts import (
     IMOW_OAUTH_URI,
     IMOW_API_URI,
@@ -24,18 +40,33 @@
     IMOW_COOKIE_HOSTS,
     IMOW_MAINTENANCE_URI,
     IMOW_USER_API_URI,
-    IMOW_I18N_BASE_URI,
 )
+from imow.common.digestcache import PayloadDigestCache
 from imow.common.exceptions import (
     LoginError,
     ApiMaintenanceError,
-    LanguageNotFoundError,
+    ClientClosingError,
 )
-from imow.common.messages import Messages
+from imow.common.i18n import MessagesRegistry, default_registry
+from imow.common.mowerindex import MowerIdentity, MowerIndex
 from imow.common.mowerstate import MowerState
+from imow.common.pacing import RequestPacer
+from imow.common.responsecache import ResponseCache
+from imow.common.singleflight import SingleFlight
+from imow.common.tokenstore import TokenStore, account_key
+from imow.common.validatorcache import ValidatorCache
+
+if TYPE_CHECKING:
+    from imow.common.messages import Messages
 
 logger = logging.getLogger("imow")
 
+# Set by ``receive_many``: every request sent from that context holds one of
+# the semaphore's slots while it is on the wire (not while it is paced).
+_request_slots: ContextVar[Optional[asyncio.Semaphore]] = ContextVar(
+    "imow_request_slots", default=None
+)
+
 
 def validate_and_fix_datetime(value: str) -> str:
     """Validate and normalise a datetime string to ``"%Y-%m-%d %H:%M"``.
@@ -73,23 +104,6 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _extract_attr(element, attr: str) -> Optional[str]:
-    """Return a single string attribute from a BeautifulSoup element, or None.
-
-    Handles the ``None`` (not found), ``NavigableString`` (no attributes) and
-    multi-valued attribute cases so callers get a plain ``str`` or ``None``.
-    """
-    getter = getattr(element, "get", None)
-    if getter is None:
-        return None
-    value = getter(attr)
-    if value is None:
-        return None
-    if isinstance(value, (list, tuple)):
-        return " ".join(str(v) for v in value) or None
-    return str(value)
-
-
 # Valid keyword names accepted by ``IMowApi.intent`` for value translation.
 _INTENT_KWARGS = frozenset({"duration", "startpoint", "starttime", "endtime"})
 
@@ -152,6 +166,26 @@ def _build_start_mowing_value(
     return f"{mower_external_id},{endtime}"
 
 
+def _build_connector(
+    limit: int = 100,
+    limit_per_host: int = 10,
+    ttl_dns_cache: Optional[int] = 300,
+    keepalive_timeout: float = 30.0,
+) -> aiohttp.TCPConnector:
+    """Build the ``TCPConnector`` for sessions created by this library.
+
+    All requests go to a handful of STIHL hosts, so resolved addresses are
+    cached for ``ttl_dns_cache`` seconds and idle connections are kept for
+    ``keepalive_timeout`` seconds instead of aiohttp's 10 s / 15 s defaults.
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=ttl_dns_cache,
+        keepalive_timeout=keepalive_timeout,
+    )
+
+
 class IMowApi:
     def __init__(
         self,
@@ -160,6 +194,19 @@ def __init__(
         token: Optional[str] = None,
         aiohttp_session: Optional[ClientSession] = None,
         lang: str = "en",
+        response_cache: Optional[ResponseCache] = None,
+        fleet_freshness: float = 0.0,
+        mower_index_ttl: float = 3600,
+        pacer: Optional[RequestPacer] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        token_store: Optional[TokenStore] = None,
+        background_token_refresh: bool = False,
+        i18n_registry: Optional[MessagesRegistry] = None,
+        payload_digests: Optional[PayloadDigestCache] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        ttl_dns_cache: Optional[int] = 300,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
     ) -> None:
         self.http_session: Optional[ClientSession] = aiohttp_session
         self.csrf_token: str = ""
@@ -178,25 +225,163 @@ def __init__(
         self._auth_lock: asyncio.Lock = asyncio.Lock()
         # Per-login OAuth state (CSRF protection for the redirect).
         self._oauth_state: str = ""
+        # Opt-in read-through cache for the per-mower and account reads.
+        # Writes (``intent``/``update_setting``) invalidate the mower's entries.
+        self.response_cache: Optional[ResponseCache] = response_cache
+        # Concurrent identical GETs share one upstream request.
+        self._flights: SingleFlight = SingleFlight()
+        # Seconds for which a ``receive_mowers`` result may answer per-mower
+        # reads (``0`` = only while the list request is still in flight).
+        self.fleet_freshness: float = fleet_freshness
+        self._fleet_snapshot: Optional[Tuple[float, List[dict]]] = None
+        # Bumped by every write: a read started before it neither refills the
+        # snapshot nor is joined by reads started after it.
+        self._generation: int = 0
+        # name/id/externalId -> mower, refilled by every ``receive_mowers``.
+        self.mower_index: MowerIndex = MowerIndex(ttl=mower_index_ttl)
+        # Every request is paced per host and per mower (see RequestPacer).
+        self.pacer: RequestPacer = pacer if pacer is not None else RequestPacer()
+        # Fails requests fast while the upstream is down or in maintenance.
+        self.circuit_breaker: CircuitBreaker = (
+            circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        )
+        # Persists the token per account so restarts can skip the login flow.
+        self.token_store: Optional[TokenStore] = token_store
+        # Renew the token off the request path (started on the first request,
+        # or explicitly via ``start_token_refresher``).
+        self.background_token_refresh: bool = background_token_refresh
+        self._token_refresh_task: Optional[asyncio.Task] = None
+        # Message tables are shared process-wide unless a registry is given.
+        self.i18n_registry: MessagesRegistry = (
+            i18n_registry if i18n_registry is not None else default_registry
+        )
+        # Opt-in: byte-identical GET bodies reuse the parsed JSON and the
+        # MowerState built from it instead of decoding and rebuilding.
+        self.payload_digests: Optional[PayloadDigestCache] = payload_digests
+        # ETag/Last-Modified per GET URL; a 304 reuses the stored parsed body.
+        self.validator_cache: ValidatorCache = (
+            validator_cache if validator_cache is not None else ValidatorCache()
+        )
+        # mower id -> the poll shared by everyone watching that mower.
+        self._watch_hubs: Dict[str, WatchHub] = {}
+        # HTTP attempts sent / failed and the seconds spent waiting on them.
+        self.requests_sent: int = 0
+        self.request_errors: int = 0
+        self.request_seconds: float = 0.0
+        # Connector settings for the session we create ourselves (an injected
+        # session keeps its own connector).
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        # Requests currently inside ``api_request``; ``close`` waits for them.
+        self._in_flight: int = 0
+        # Set while ``close`` drains; new requests are rejected meanwhile.
+        self._closing: bool = False
+        self._idle: asyncio.Event = asyncio.Event()
+        self._idle.set()
+        # Seconds from ``start()`` to the first fleet state (``None`` before).
+        self.time_to_first_state: Optional[float] = None
 
     # Number of days before expiry at which we proactively re-authenticate.
     _TOKEN_REFRESH_LEEWAY_SECONDS = 86400
 
-    # Pause between the mower-state and statistics requests. Issuing them
-    # back-to-back can trigger upstream timeouts, so callers that need both
-    # should use ``receive_mower_state_with_statistics`` rather than pacing
-    # the two calls themselves.
-    _STATISTICS_FETCH_DELAY_SECONDS = 1
+    # How often the background refresher re-checks a token of unknown expiry,
+    # and how long it waits after a failed refresh before trying again.
+    _TOKEN_REFRESH_RECHECK_SECONDS = 3600
+    _TOKEN_REFRESH_RETRY_SECONDS = 60
+
+    async def __aenter__(self) -> "IMowApi":
+        try:
+            await self.start()
+        except BaseException:
+            # ``__aexit__`` does not run when entering fails.
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def start(self) -> List[MowerState]:
+        """Get ready for requests and return the fleet.
+
+        Loads the message tables, obtains the token (restored from
+        :attr:`token_store` or by logging in, when credentials are set) and
+        warms up the connection to the API host all at once, then fetches the
+        mowers with ``receive_mowers()``. The seconds this took are kept in
+        :attr:`time_to_first_state`. Called by ``async with IMowApi(...)``.
+        """
+        started = time.monotonic()
+        # The i18n and login requests connect to their hosts themselves.
+        steps: List[Awaitable[Any]] = [
+            self.fetch_messages(),
+            self.warm_up([IMOW_API_URI]),
+        ]
+        if self.api_email and self.api_password:
+            steps.append(self.get_token())
+        tasks = [asyncio.ensure_future(step) for step in steps]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        mowers = await self.receive_mowers()
+        self.time_to_first_state = time.monotonic() - started
+        logger.info("First fleet state after %.2fs", self.time_to_first_state)
+        return mowers
 
-    async def close(self):
+    async def close(self, drain_timeout: float = 10.0):
         """Cleanup the aiohttp Session.
 
+        Stops the token refresher and all watchers, then waits up to
+        ``drain_timeout`` seconds for requests still in flight, and as long
+        again for i18n revalidations using this session, to finish. Requests
+        started meanwhile raise :class:`ClientClosingError`.
+
         Only closes the session if this instance created it. A caller-injected
         session (e.g. Home Assistant's shared/created client session) is owned by
         the caller and must not be closed here.
         """
-        if self._owns_session and self.http_session and not self.http_session.closed:
-            await self.http_session.close()
+        self._closing = True
+        try:
+            await self.stop_token_refresher()
+            hubs, self._watch_hubs = list(self._watch_hubs.values()), {}
+            for hub in hubs:
+                hub.cancel()
+            if self._in_flight:
+                try:
+                    await asyncio.wait_for(self._idle.wait(), drain_timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Closing with %d request(s) still in flight", self._in_flight
+                    )
+            if self.http_session is not None and not self.http_session.closed:
+                # Let i18n revalidations on this session finish before it goes.
+                await self.i18n_registry.wait_revalidations(
+                    self.http_session, drain_timeout
+                )
+            if (
+                self._owns_session
+                and self.http_session
+                and not self.http_session.closed
+            ):
+                await self.http_session.close()
+        finally:
+            self._closing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the request counters, token expiry and circuit state."""
+        return {
+            "requests": self.requests_sent,
+            "errors": self.request_errors,
+            "request_seconds": round(self.request_seconds, 3),
+            "token_expires": self.token_expires,
+            "circuit": self.circuit_breaker.state,
+            "in_flight": self._in_flight,
+            "time_to_first_state": self.time_to_first_state,
+        }
 
     def _ensure_session(self) -> ClientSession:
         """Make sure we have a usable aiohttp session, creating an owned one.
@@ -204,7 +389,14 @@ def _ensure_session(self) -> ClientSession:
         Returns the (now guaranteed non-None) session for convenient narrowing.
         """
         if not self.http_session or self.http_session.closed:
-            self.http_session = aiohttp.ClientSession(raise_for_status=True)
+            self.http_session = aiohttp.ClientSession(
+                connector=_build_connector(
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                raise_for_status=True,
+            )
             self._owns_session = True
         return self.http_session
 
@@ -239,12 +431,84 @@ def _token_needs_refresh(self) -> bool:
         remaining = (self.token_expires - _utcnow()).total_seconds()
         return remaining <= self._TOKEN_REFRESH_LEEWAY_SECONDS
 
+    def _token_expired(self) -> bool:
+        return self.token_expires is not None and self.token_expires <= _utcnow()
+
+    def start_token_refresher(self) -> None:
+        """Start renewing the token in the background before it expires.
+
+        The refresher logs in again once the token enters the refresh leeway
+        and swaps the new token in only when the login succeeded, so requests
+        keep using the still-valid old token meanwhile instead of waiting for
+        the login. The 401 re-auth in ``api_request`` stays as a fallback.
+        Must be called from a running event loop; :meth:`close` stops it.
+        """
+        if self._token_refresh_task is None or self._token_refresh_task.done():
+            # Started by whichever request comes first, possibly one inside
+            # ``receive_many``; the refresher outlives it, so drop its slots.
+            context = copy_context()
+            context.run(_request_slots.set, None)
+            self._token_refresh_task = asyncio.get_running_loop().create_task(
+                self._token_refresh_loop(), context=context
+            )
+
+    async def stop_token_refresher(self) -> None:
+        """Stop the background refresher started by ``start_token_refresher``."""
+        task, self._token_refresh_task = self._token_refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _token_refresh_loop(self) -> None:
+        while True:
+            if not self.access_token:
+                delay = 0.0
+            elif self.token_expires is None:
+                # Injected token of unknown expiry: the 401 path handles it.
+                delay = self._TOKEN_REFRESH_RECHECK_SECONDS
+            else:
+                delay = (
+                    self.token_expires - _utcnow()
+                ).total_seconds() - self._TOKEN_REFRESH_LEEWAY_SECONDS
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self._refresh_token_in_background()
+            except Exception as err:
+                logger.warning(
+                    "Background token refresh failed, retrying in %ss: %s",
+                    self._TOKEN_REFRESH_RETRY_SECONDS,
+                    err,
+                )
+                await asyncio.sleep(self._TOKEN_REFRESH_RETRY_SECONDS)
+
+    async def _refresh_token_in_background(self) -> None:
+        async with self._auth_lock:
+            if not self._token_needs_refresh():
+                # Someone else (e.g. the 401 path) already renewed it.
+                return
+            if not self.api_email or not self.api_password:
+                raise LoginError("Got no credentials to authenticate, please provide")
+            logger.info("Refreshing access_token in the background")
+            # __authenticate only assigns the new token once the login
+            # succeeded, so concurrent requests keep the old one until then.
+            await self.__authenticate(self.api_email, self.api_password)
+            await self._persist_token()
+
     async def check_api_maintenance(self) -> None:
         """Probe the maintenance endpoint and raise if the API is unavailable.
 
         The probe passes ``_probe=True`` so that a 500 from the maintenance
         endpoint itself does not recurse back into ``check_api_maintenance``.
 
+        The result is recorded in :attr:`circuit_breaker`, which reuses it for
+        a while instead of probing again on every HTTP 500.
+
         Raises:
             ApiMaintenanceError: If the upstream reports a disruption/outage.
         """
@@ -259,6 +523,19 @@ async def check_api_maintenance(self) -> None:
             _probe=True,
         )
         logger.debug(status)
+        self.circuit_breaker.record_maintenance(status)
+        self._raise_for_maintenance(status)
+
+    async def _check_api_maintenance_cached(self) -> None:
+        """Like :meth:`check_api_maintenance`, reusing a recent probe result."""
+        status = self.circuit_breaker.cached_maintenance()
+        if status is None:
+            await self.check_api_maintenance()
+        else:
+            self._raise_for_maintenance(status)
+
+    @staticmethod
+    def _raise_for_maintenance(status: dict) -> None:
         if status["serverDisrupted"] or status["serverDown"]:
             msg = (
                 f"iMow API is under Maintenance -> "
@@ -293,6 +570,8 @@ async def get_token(
         token_before = self.access_token
 
         async with self._auth_lock:
+            if not self.access_token and not force_reauth:
+                await self._restore_token()
             another_refresh_happened = (
                 force_reauth and self.access_token and self.access_token != token_before
             )
@@ -315,12 +594,42 @@ async def get_token(
                     )
                 logger.debug("Get Token: (re-)authenticating")
                 await self.__authenticate(self.api_email, self.api_password)
+                await self._persist_token()
 
         token = self.access_token or ""
         if return_expire_time:
             return token, self.token_expires
         return token
 
+    async def _restore_token(self) -> None:
+        """Load this account's token from :attr:`token_store`, if any.
+
+        A restored token that is (nearly) expired is still loaded; the caller's
+        usual ``_token_needs_refresh`` check then re-authenticates.
+        """
+        if self.token_store is None or not self.api_email:
+            return
+        try:
+            stored = await self.token_store.load(account_key(self.api_email))
+        except Exception as err:
+            logger.warning("Could not load token from token store: %s", err)
+            return
+        if stored is not None:
+            logger.debug("Get Token: restored token from token store")
+            self.access_token, self.token_expires = stored
+
+    async def _persist_token(self) -> None:
+        """Write the current token to :attr:`token_store`, if configured."""
+        if self.token_store is None or not self.api_email or not self.access_token:
+            return
+        try:
+            await self.token_store.save(
+                account_key(self.api_email), self.access_token, self.token_expires
+            )
+        except Exception as err:
+            # A failing store must not fail the login that just succeeded.
+            logger.warning("Could not save token to token store: %s", err)
+
     async def api_logout(self) -> None:
         """Best-effort logout: POST the logout form (if a CSRF token is known)
         and clear STIHL cookies from the jar.
@@ -398,6 +707,9 @@ async def __authenticate(
             url, "POST", payload=payload, headers=headers, authenticated=False
         )
 
+        # Only needed to parse the auth redirect, so imported on first login.
+        from furl import furl
+
         response_url_query_args = furl(response.real_url).fragment.args
         if "access_token" not in response_url_query_args:
             raise LoginError(
@@ -457,24 +769,18 @@ async def __fetch_new_csrf_token_and_request_id(
             response.headers.get("Content-Type"),
         )
 
-        soup = BeautifulSoup(html, "html.parser")
+        # Stops tokenizing as soon as both fields are found; falls back to the
+        # <meta name="csrf-token"> tag if the hidden input is missing. Imported
+        # here as it is only needed during login.
+        from imow.common.loginform import extract_login_form
 
-        upstream_csrf_token = _extract_attr(
-            soup.find("input", {"name": "csrf-token"}), "value"
-        )
-        if not upstream_csrf_token:
-            # Fall back to the <meta name="csrf-token"> tag if the hidden input
-            # is missing (e.g. markup change).
-            upstream_csrf_token = _extract_attr(
-                soup.find("meta", {"name": "csrf-token"}), "content"
-            )
-        upstream_request_id = _extract_attr(
-            soup.find("input", {"name": "requestId"}), "value"
-        )
+        form = extract_login_form(html)
+        upstream_csrf_token = form.csrf_token
+        upstream_request_id = form.request_id
 
         if not upstream_csrf_token or not upstream_request_id:
             # Distinguish the common failure modes for a clear, actionable error.
-            if soup.find("stihl-imow-root") is not None:
+            if form.spa_shell:
                 detail = (
                     "landed on the already-authenticated SPA shell instead of "
                     "the login form (stale session cookies)"
@@ -494,39 +800,99 @@ async def __fetch_new_csrf_token_and_request_id(
         logger.debug("CSRF: new token and request id <redacted>")
         return self.csrf_token, self.requestId
 
+    async def warm_up(
+        self, hosts: Optional[Iterable[str]] = None, timeout: float = 10.0
+    ) -> int:
+        """Open connections to the hosts the next requests will use.
+
+        Sends a ``HEAD`` to every host at once, so name resolution and the TLS
+        handshake are done before the first real request and the connection
+        waits in the keep-alive pool (see ``keepalive_timeout``). By default
+        the API host is warmed, plus the app and OAuth hosts when the message
+        tables or a login are still needed. Failures are only logged.
+
+        Args:
+            hosts: URLs to warm instead (e.g. ``IMOW_USER_API_URI`` before
+                ``receive_account``).
+            timeout: Seconds to wait per host.
+
+        Returns:
+            The number of hosts that answered.
+        """
+        if hosts is None:
+            hosts = [IMOW_API_URI]
+            if not self.messages_en:
+                hosts.append(IMOW_APP_URI)
+            if not self.access_token and self.api_email and self.api_password:
+                hosts.extend([IMOW_APP_URI, IMOW_OAUTH_URI])
+        session = self._ensure_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        async def head(url: str) -> bool:
+            try:
+                async with session.head(
+                    url, raise_for_status=False, timeout=client_timeout
+                ):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                logger.debug("Warming up %s failed: %s", url, err)
+                return False
+
+        answered = await asyncio.gather(*(head(url) for url in dict.fromkeys(hosts)))
+        return sum(answered)
+
     async def fetch_messages(self) -> None:
-        """Download and cache the i18n message tables from the SPA.
+        """Load the i18n message tables from the SPA.
 
-        Fetches the English tables (used for the language-neutral
-        ``machineState``) and, when ``self.lang != "en"``, the localized tables.
+        Loads the English tables (used for the language-neutral
+        ``machineState``) and, when ``self.lang != "en"``, the localized tables,
+        both at once. Tables come from :attr:`i18n_registry`, so each language
+        is downloaded once per process and shared between clients.
 
         Raises:
             LanguageNotFoundError: If the requested language file does not exist.
             aiohttp.ClientResponseError: For any other HTTP error.
         """
         session = self._ensure_session()
-        try:
-            url_en = f"{IMOW_I18N_BASE_URI}/en.json"
-            async with session.request("GET", url_en) as response_en:
-                i18n_en = await response_en.json(content_type=None)
-            self.messages_en = Messages(i18n_en)
-            if self.lang != "en":
-                url_user = f"{IMOW_I18N_BASE_URI}/{self.lang}.json"
-                async with session.request("GET", url_user) as response_user:
-                    i18n_user = await response_user.json(content_type=None)
-                    self.messages_user = Messages(i18n_user)
-            else:
-                self.messages_user = self.messages_en
+        registry = self.i18n_registry
+        if self.lang == "en":
+            self.messages_en = await registry.get(session, "en")
+            self.messages_user = self.messages_en
+        else:
+            # Any error propagates: leaving messages_en unset would break
+            # state-message resolution on the next call.
+            self.messages_en, self.messages_user = await asyncio.gather(
+                registry.get(session, "en"), registry.get(session, self.lang)
+            )
 
-        except ClientResponseError as e:
-            if e.status == 404:
-                raise LanguageNotFoundError(
-                    f"Language-File '{self.lang}.json' not found on imow upstream "
-                    f"({IMOW_I18N_BASE_URI}/{self.lang}.json)"
-                ) from e
-            # Any other HTTP error must not be swallowed: leaving messages_en
-            # unset would break state-message resolution on the next call.
-            raise
+    async def receive_i18n(self, lang: Optional[str] = None) -> dict:
+        """Return the complete upstream language file (default: ``self.lang``).
+
+        The shared message tables only keep the status and error texts; this
+        fetches the whole file on demand without keeping it.
+
+        Raises:
+            LanguageNotFoundError: If the language file does not exist.
+            aiohttp.ClientResponseError: For any other HTTP error.
+        """
+        return await self.i18n_registry.fetch_raw(
+            self._ensure_session(), lang or self.lang
+        )
+
+    async def set_language(self, lang: str) -> None:
+        """Switch the language of ``stateMessage`` texts.
+
+        Languages already loaded by any client are reused without a download.
+
+        Raises:
+            LanguageNotFoundError: If the language file does not exist; the
+                previous language stays active.
+        """
+        session = self._ensure_session()
+        self.messages_user = await self.i18n_registry.get(session, lang)
+        self.lang = lang
+        if self.messages_en is None:
+            await self.fetch_messages()
 
     def _default_headers(self) -> dict:
         """Browser-like default headers sent with every API request.
@@ -565,16 +931,81 @@ async def _request_json(
 
         Convenience wrapper used by all read endpoints so callers don't hand-roll
         ``json.loads(await response.text())``.
+
+        Plain GETs are coalesced: concurrent calls for the same URL and auth
+        identity await one shared request (including any 401 re-auth and
+        retries) and all receive the same parsed object, or the same error.
+
+        With :attr:`payload_digests`, a GET body identical to the previous one
+        for the same URL is not decoded again; the previous object is returned.
+
+        Plain GETs are also conditional: when the last response for the URL
+        carried an ``ETag``/``Last-Modified``, they are sent back as
+        ``If-None-Match``/``If-Modified-Since`` and a ``304`` returns the body
+        parsed back then (see :attr:`validator_cache`).
         """
-        response = await self.api_request(
-            url,
-            method,
-            payload=payload,
-            headers=headers,
-            authenticated=authenticated,
-            _probe=_probe,
+        plain_get = method == "GET" and not payload and not headers
+        conditional = plain_get and not _probe
+
+        async def request() -> Any:
+            response = await self.api_request(
+                url,
+                method,
+                payload=payload,
+                headers=headers,
+                authenticated=authenticated,
+                _probe=_probe,
+                _conditional=conditional,
+            )
+            if response.status == 304:
+                found, body = self.validator_cache.not_modified(url)
+                if found:
+                    return body
+                # The stored body was evicted in the meantime; fetch it again.
+                response = await self.api_request(
+                    url, method, authenticated=authenticated
+                )
+            if self.payload_digests is None or method != "GET":
+                parsed = await response.json(content_type=None)
+            else:
+                parsed = self.payload_digests.parse(str(url), await response.read())
+            if conditional:
+                self.validator_cache.store(url, response.headers, parsed)
+            return parsed
+
+        if not plain_get:
+            return await request()
+        return await self._flights.do(
+            self._flight_key(method, url, authenticated), request
         )
-        return await response.json(content_type=None)
+
+    def _flight_key(self, method: str, url: Any, authenticated: bool = True) -> tuple:
+        """Key identifying identical requests for :class:`SingleFlight`."""
+        token = self.access_token if authenticated else None
+        return (method, str(url), token, self._generation)
+
+    def _invalidate_fleet(self) -> None:
+        """Drop the fleet snapshot after a write, including pending list reads."""
+        self._fleet_snapshot = None
+        self._generation += 1
+
+    async def _cached_request_json(self, endpoint: str, key: Any, url: str) -> Any:
+        """GET ``url`` as JSON, served from ``response_cache`` when enabled.
+
+        ``endpoint`` selects the TTL (see
+        :data:`~imow.common.responsecache.DEFAULT_TTLS`); ``key`` is usually the
+        mower id.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return await self._request_json(url, "GET")
+        key = str(key)
+        cached = cache.get(endpoint, key)
+        if cached is not None:
+            return cached
+        payload = await self._request_json(url, "GET")
+        cache.put(endpoint, key, payload)
+        return payload
 
     async def api_request(
         self,
@@ -585,6 +1016,7 @@ async def api_request(
         authenticated: bool = True,
         _is_retry: bool = False,
         _probe: bool = False,
+        _conditional: bool = False,
     ) -> aiohttp.ClientResponse:
         """
         Do a standardized request against the stihl imow webapi, with predefined
@@ -606,80 +1038,143 @@ async def api_request(
         :param _probe: internal flag for the maintenance probe; prevents a 500
             from the maintenance endpoint recursing back into the maintenance
             check. Non-GET requests are issued single-shot (not retried).
+        :param _conditional: internal flag set by :meth:`_request_json`; adds the
+            ``If-None-Match``/``If-Modified-Since`` headers remembered for a GET
+            URL, so the response may be a ``304`` without a body.
         :return: the aiohttp.ClientResponse (body already buffered)
+        :raises ClientClosingError: for an authenticated request started while
+            :meth:`close` waits for the requests in flight. Their 401 retries,
+            and the login and maintenance requests they need, still go through.
         """
-        session = self._ensure_session()
-        if not self.messages_en:
-            await self.fetch_messages()
-
-        if authenticated:
-            if not self.access_token and (self.api_email and self.api_password):
-                # No token yet but we can obtain one.
-                await self.get_token()
-            elif self.token_expires and self._token_needs_refresh():
-                logger.info("Fetching new access_token because old one expires soon")
-                await self.get_token(force_reauth=True)
-
-        if not payload:
-            payload = {}
-
-        headers_obj = self._default_headers()
-        if headers:
-            headers_obj.update(headers)
-
-        max_attempts = 3 if method == "GET" else 1
-        for attempt in range(1, max_attempts + 1):
-            try:
-                response = await session.request(
-                    method, url, headers=headers_obj, data=payload
+        if self._closing and authenticated and not _is_retry:
+            raise ClientClosingError("The client is closing; request not sent")
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            session = self._ensure_session()
+            if authenticated:
+                # The auth handshake and the maintenance probe don't build
+                # states, so they don't wait for the message tables.
+                if not self.messages_en:
+                    await self.fetch_messages()
+                if self.background_token_refresh:
+                    self.start_token_refresher()
+                refresher_running = (
+                    self._token_refresh_task is not None
+                    and not self._token_refresh_task.done()
                 )
-                # Buffer the body so the response stays usable after the
-                # connection is released back to the pool.
-                await response.read()
-                response.raise_for_status()
-                return response
-            except ClientResponseError as e:
-                if (
-                    authenticated
-                    and e.status == 401
-                    and not _is_retry
-                    and (self.api_email and self.api_password)
+                if not self.access_token and (self.api_email and self.api_password):
+                    # No token yet but we can obtain one.
+                    await self.get_token()
+                elif (
+                    self.token_expires
+                    and self._token_needs_refresh()
+                    # The background refresher renews it; keep using the old token
+                    # unless it has actually expired.
+                    and not (refresher_running and not self._token_expired())
                 ):
-                    logger.info("Got HTTP 401, re-authenticating once and retrying")
+                    logger.info(
+                        "Fetching new access_token because old one expires soon"
+                    )
                     await self.get_token(force_reauth=True)
-                    return await self.api_request(
-                        url,
+
+            breaker = self.circuit_breaker
+            if not _probe and not _is_retry and not breaker.allow_request():
+                raise ApiMaintenanceError(
+                    "iMow API is unavailable (circuit open after repeated failures "
+                    "or reported maintenance); not sending request, next attempt in "
+                    f"{breaker.retry_after():.0f}s"
+                )
+
+            if not payload:
+                payload = {}
+
+            headers_obj = self._default_headers()
+            if _conditional and method == "GET":
+                headers_obj.update(self.validator_cache.request_headers(url))
+            if headers:
+                headers_obj.update(headers)
+
+            max_attempts = 3 if method == "GET" else 1
+            for attempt in range(1, max_attempts + 1):
+                await self.pacer.acquire(url)
+                slots = _request_slots.get()
+                try:
+                    async with slots or contextlib.nullcontext():
+                        self.requests_sent += 1
+                        started = time.monotonic()
+                        try:
+                            response = await session.request(
+                                method, url, headers=headers_obj, data=payload
+                            )
+                            # Buffer the body so the response stays usable after
+                            # the connection is released back to the pool.
+                            await response.read()
+                        finally:
+                            self.request_seconds += time.monotonic() - started
+                    response.raise_for_status()
+                    if not _probe:
+                        breaker.record_success()
+                    return response
+                except ClientResponseError as e:
+                    self.request_errors += 1
+                    if (
+                        authenticated
+                        and e.status == 401
+                        and not _is_retry
+                        and (self.api_email and self.api_password)
+                    ):
+                        logger.info("Got HTTP 401, re-authenticating once and retrying")
+                        await self.get_token(force_reauth=True)
+                        return await self.api_request(
+                            url,
+                            method,
+                            payload=payload,
+                            headers=headers,
+                            authenticated=authenticated,
+                            _is_retry=True,
+                            _probe=_probe,
+                            _conditional=_conditional,
+                        )
+                    # Don't recurse into the maintenance check from the probe itself.
+                    if _probe:
+                        raise e
+                    if e.status >= 500:
+                        breaker.record_failure()
+                    else:
+                        # Any other answer proves the upstream is reachable.
+                        breaker.record_success()
+                    if e.status == 500:
+                        await self._check_api_maintenance_cached()
+                    raise e
+                except (
+                    aiohttp.ClientConnectionError,
+                    asyncio.TimeoutError,
+                ) as e:
+                    self.request_errors += 1
+                    if attempt >= max_attempts:
+                        if not _probe:
+                            breaker.record_failure()
+                        raise e
+                    backoff = 0.5 * (2 ** (attempt - 1)) + random.uniform(0, 0.25)
+                    logger.debug(
+                        "Transient error on %s %s (attempt %s/%s): %s; "
+                        "retrying in %.2fs",
                         method,
-                        payload=payload,
-                        headers=headers,
-                        authenticated=authenticated,
-                        _is_retry=True,
-                        _probe=_probe,
+                        url,
+                        attempt,
+                        max_attempts,
+                        e,
+                        backoff,
                     )
-                # Don't recurse into the maintenance check from the probe itself.
-                if e.status == 500 and not _probe:
-                    await self.check_api_maintenance()
-                raise e
-            except (
-                aiohttp.ClientConnectionError,
-                asyncio.TimeoutError,
-            ) as e:
-                if attempt >= max_attempts:
-                    raise e
-                backoff = 0.5 * (2 ** (attempt - 1)) + random.uniform(0, 0.25)
-                logger.debug(
-                    "Transient error on %s %s (attempt %s/%s): %s; retrying in %.2fs",
-                    method,
-                    url,
-                    attempt,
-                    max_attempts,
-                    e,
-                    backoff,
-                )
-                await asyncio.sleep(backoff)
+                    await asyncio.sleep(backoff)
 
-        # Unreachable: the loop either returns or raises on the final attempt.
-        raise RuntimeError("api_request exhausted retries without returning")
+            # Unreachable: the loop either returns or raises on the final attempt.
+            raise RuntimeError("api_request exhausted retries without returning")
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
 
     async def intent(
         self,
@@ -815,6 +1310,11 @@ async def intent(
             return None
 
         response = await self.api_request(url, "POST", payload=payload)
+        self._invalidate_fleet()
+        if self.response_cache is not None:
+            self.response_cache.invalidate_mower(
+                mower_id=mower_id or None, external_id=mower_external_id
+            )
         if response.ok:
             logger.debug(
                 "Success: Created mower (extId:%s) ActionObject with contents:",
@@ -842,6 +1342,11 @@ async def update_setting(
         Raises:
             KeyError: If ``setting`` is not a known settings field.
         """
+        # The PUT sends back every field, so it must be built from fresh state
+        # rather than a cached one or it could revert a concurrent change.
+        self._invalidate_fleet()
+        if self.response_cache is not None:
+            self.response_cache.invalidate_mower(mower_id=mower_id)
         mower_state = await self.receive_mower_by_id(mower_id)
 
         payload_fields = {
@@ -876,18 +1381,65 @@ async def update_setting(
                 method="PUT",
                 payload=json.dumps(payload_fields, indent=2).encode("utf-8"),
             )
+            self._invalidate_fleet()
+            if setting == "name":
+                self.mower_index.invalidate()
+            if self.payload_digests is not None:
+                # The state below is updated in place; don't hand it out again
+                # for an older payload.
+                self.payload_digests.discard(("mower", str(mower_state.id)))
+            if self.response_cache is not None:
+                self.response_cache.invalidate_mower(mower_id=mower_state.id)
+                self.response_cache.put("mower", str(mower_state.id), updated)
             mower_state.replace_state(updated)
             return mower_state
 
         logger.info("%s is already %s.", setting, new_value)
         return await self.receive_mower_by_id(mower_id)
 
+    async def _mower_identity(self, field: str, value: Any) -> MowerIdentity:
+        """Resolve a mower by ``id``, ``name`` or ``externalId`` via the index.
+
+        On a miss (unknown mower or expired index) the index is refreshed with
+        one ``receive_mowers`` call before giving up.
+
+        Raises:
+            LookupError: If no mower matches after the refresh.
+        """
+        identity = self.mower_index.lookup(field, value)
+        if identity is None:
+            await self.receive_mowers()
+            identity = self.mower_index.lookup(field, value)
+        if identity is None:
+            raise LookupError(f"Mower with {field} {value} not found in upstream")
+        return identity
+
+    async def _receive_mower_by(self, field: str, value: Any) -> MowerState:
+        """Return the current state of the mower whose ``field`` is ``value``.
+
+        Costs one request either way: a per-id read when the index knows the
+        mower, otherwise the ``/mowers/`` list that also refreshes the index.
+        """
+        identity = self.mower_index.lookup(field, value)
+        if identity is None:
+            for mower in await self.receive_mowers():
+                if str(getattr(mower, field, "")) == str(value):
+                    return mower
+            raise LookupError(f"Mower with {field} {value} not found in upstream")
+        try:
+            return await self.receive_mower_by_id(identity.id)
+        except ClientResponseError as e:
+            if e.status == 404:
+                self.mower_index.invalidate()
+                raise LookupError(
+                    f"Mower with {field} {value} not found in upstream"
+                ) from e
+            raise
+
     async def get_status_by_name(self, mower_name: str) -> dict:
         logger.debug("get_status_by_name: %s", mower_name)
-        for mower in await self.receive_mowers():
-            if mower.name == mower_name:
-                return mower.status
-        raise LookupError(f"Mower with name {mower_name} not found in upstream")
+        mower = await self._receive_mower_by("name", mower_name)
+        return mower.status
 
     async def get_status_by_id(self, mower_id: Union[str, int]) -> dict:
         if not isinstance(mower_id, str):
@@ -905,44 +1457,33 @@ async def get_status_by_id(self, mower_id: Union[str, int]) -> dict:
 
     async def get_status_by_action_id(self, mower_action_id: str) -> dict:
         logger.debug("get_status_by_action_id: %s", mower_action_id)
-        for mower in await self.receive_mowers():
-            if mower.externalId == mower_action_id:
-                return mower.status
-        raise LookupError(
-            f"Mower with externalId {mower_action_id} not found in upstream"
-        )
+        mower = await self._receive_mower_by("externalId", mower_action_id)
+        return mower.status
 
     async def get_mower_action_id_from_name(self, mower_name: str) -> str:
         logger.debug("get_mower_action_id_from_name: %s", mower_name)
-        for mower in await self.receive_mowers():
-            if mower.name == mower_name:
-                return mower.externalId
-        raise LookupError(f"Mower with name {mower_name} not found in upstream")
+        identity = await self._mower_identity("name", mower_name)
+        return identity.externalId
 
     async def get_mower_action_id_from_id(self, mower_id: Union[str, int]) -> str:
         logger.debug("get_mower_action_id_from_id: %s", mower_id)
-        try:
-            response = await self.receive_mower_by_id(mower_id)
-            logger.debug(" - %s", response.externalId)
-            return response.externalId
-        except ClientResponseError as e:
-            if e.status == 404:
-                raise LookupError(
-                    f"Mower with id {mower_id} not found in upstream"
-                ) from e
-            raise
+        identity = await self._mower_identity("id", mower_id)
+        logger.debug(" - %s", identity.externalId)
+        return identity.externalId
 
     async def get_mower_id_from_name(self, mower_name: str) -> str:
         logger.debug("get_mower_id_from_name: %s", mower_name)
-        for mower in await self.receive_mowers():
-            if mower.name == mower_name:
-                return mower.id
-        raise LookupError(f"Mower with name {mower_name} not found in upstream")
+        identity = await self._mower_identity("name", mower_name)
+        return identity.id
 
     async def receive_mowers(self) -> List[MowerState]:
         logger.debug("receive_mowers: ")
+        generation = self._generation
         payload = await self._request_json(f"{IMOW_API_URI}/mowers/", "GET")
-        mowers = [MowerState(mower, self) for mower in payload]
+        if generation == self._generation:
+            self._fleet_snapshot = (time.monotonic(), payload)
+        self.mower_index.update(payload)
+        mowers = [self._mower_state(mower) for mower in payload]
         for mower in mowers:
             logger.debug("  - %s", mower.name)
         return mowers
@@ -956,27 +1497,203 @@ async def receive_account(self) -> dict:
         durable account reference.
         """
         logger.debug("receive_account: ")
-        return await self._request_json(f"{IMOW_USER_API_URI}/me/", "GET")
+        return await self._cached_request_json(
+            "account", "me", f"{IMOW_USER_API_URI}/me/"
+        )
 
     async def receive_mower_by_name(self, mower_name: str) -> MowerState:
         logger.debug("get_mower_from_name: %s", mower_name)
-        for mower in await self.receive_mowers():
-            if mower.name == mower_name:
-                logger.debug(mower)
-                return mower
-        raise LookupError(f"Mower with name {mower_name} not found in upstream")
+        mower = await self._receive_mower_by("name", mower_name)
+        logger.debug(mower)
+        return mower
+
+    def _mower_state(self, payload: dict) -> MowerState:
+        """Wrap a mower payload, reusing the last state built from the same object.
+
+        Only with :attr:`payload_digests`; the payload object is the same when
+        its body was byte-identical, so nothing needs to be rebuilt.
+        """
+        if self.payload_digests is None:
+            return MowerState(payload, self)
+        return self.payload_digests.derive(
+            ("mower", str(payload.get("id"))),
+            payload,
+            lambda mower: MowerState(mower, self),
+        )
+
+    async def _mower_payload_from_fleet(
+        self, mower_id: Union[str, int]
+    ) -> Optional[dict]:
+        """Return a mower's payload from the fleet list, if one is available.
+
+        The ``/mowers/`` list carries every mower's full state, so a per-id read
+        can piggyback on a list request that is still in flight, or on one
+        answered within ``fleet_freshness`` seconds. Returns ``None`` when
+        neither applies (or the mower is not in the list) so the caller falls
+        back to its own request.
+        """
+        flight = self._flights.in_flight(
+            self._flight_key("GET", f"{IMOW_API_URI}/mowers/")
+        )
+        if flight is not None:
+            try:
+                fleet = await asyncio.shield(flight)
+            except Exception:
+                return None
+        elif (
+            self._fleet_snapshot is not None
+            and time.monotonic() - self._fleet_snapshot[0] < self.fleet_freshness
+        ):
+            fleet = self._fleet_snapshot[1]
+        else:
+            return None
+        for payload in fleet:
+            if str(payload.get("id")) == str(mower_id):
+                return payload
+        return None
 
     async def receive_mower_by_id(self, mower_id: Union[str, int]) -> MowerState:
         logger.debug("receive_mower: %s", mower_id)
-        payload = await self._request_json(f"{IMOW_API_URI}/mowers/{mower_id}/", "GET")
-        mower = MowerState(payload, self)
+        payload = await self._mower_payload_from_fleet(mower_id)
+        if payload is None:
+            payload = await self._cached_request_json(
+                "mower", mower_id, f"{IMOW_API_URI}/mowers/{mower_id}/"
+            )
+        mower = self._mower_state(payload)
         logger.debug(mower)
         return mower
 
+    async def receive_many(
+        self,
+        mower_ids: Iterable[Union[str, int]],
+        include: Iterable[str] = ("state",),
+        concurrency: int = 4,
+    ) -> AsyncIterator[MowerResult]:
+        """Read several endpoints for many mowers, yielding each mower when done::
+
+            async for result in api.receive_many(ids, {"state", "statistics"}):
+                if result.ok:
+                    ...
+
+        Mowers are yielded in completion order, so the first result is
+        available without waiting for the whole batch. At most ``concurrency``
+        requests are in flight at once; a read waiting for the pacer (or
+        answered from a cache) does not count. A failing read does not fail the
+        batch: it is recorded in ``result.errors`` under its ``include`` name
+        and the other parts are still returned.
+
+        Args:
+            mower_ids: The mowers to read (duplicates are read once).
+            include: Any of ``"state"``, ``"statistics"``, ``"week_mow_time"``
+                and ``"start_points"``.
+            concurrency: Upper bound on requests in flight.
+
+        Raises:
+            ValueError: For an unknown ``include`` name or ``concurrency < 1``.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        include = list(dict.fromkeys(include))
+        unknown = set(include) - set(BULK_ENDPOINTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown receive_many include(s): {sorted(unknown)}. "
+                f"Valid names are {sorted(BULK_ENDPOINTS)}."
+            )
+        ids = list(dict.fromkeys(str(mower_id) for mower_id in mower_ids))
+        done: "asyncio.Queue[MowerResult]" = asyncio.Queue()
+
+        async def read(result: MowerResult, name: str) -> None:
+            try:
+                value = await getattr(self, BULK_ENDPOINTS[name])(result.mower_id)
+            except Exception as err:
+                logger.debug("receive_many: %s of %s failed: %s", name, result, err)
+                result.errors[name] = err
+            else:
+                setattr(result, name, value)
+
+        async def read_mower(mower_id: str) -> None:
+            result = MowerResult(mower_id)
+            await asyncio.gather(*(read(result, name) for name in include))
+            done.put_nowait(result)
+
+        async def read_all() -> None:
+            # The reads see the slots; they are gone again once the reads end,
+            # even when the consumer stopped early and this task was cancelled.
+            token = _request_slots.set(asyncio.Semaphore(concurrency))
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for mower_id in ids:
+                        group.create_task(read_mower(mower_id))
+            finally:
+                _request_slots.reset(token)
+
+        # The task group runs outside the generator, so a consumer that stops
+        # early just cancels it instead of unwinding it at a ``yield``.
+        reader = asyncio.ensure_future(read_all())
+        try:
+            for _ in ids:
+                yield await done.get()
+            await reader
+        finally:
+            if not reader.done():
+                reader.cancel()
+                try:
+                    await reader
+                except asyncio.CancelledError:
+                    pass
+
+    async def watch(
+        self,
+        mower_id: Union[str, int],
+        interval: float = 30.0,
+        changes: bool = False,
+        state: Optional[MowerState] = None,
+    ) -> AsyncIterator[Union[MowerState, Tuple[MowerState, FrozenSet[str]]]]:
+        """Yield the mower's state whenever it changed::
+
+            async for mower in api.watch(mower_id):
+                ...
+
+        All watchers of a mower share one poll every ``interval`` seconds (the
+        shortest interval asked for) and the same :class:`MowerState`, which is
+        updated in place. A watcher first receives the current state, then one
+        item per change; if it falls behind, it gets only the newest state,
+        with the change sets merged. The poll stops when the last watcher
+        leaves (breaks out, is cancelled or closes the generator); ``close()``
+        stops every poll and ends every watch.
+
+        Args:
+            mower_id: The mower to watch.
+            interval: Seconds between polls.
+            changes: Yield ``(state, changed_fields)`` instead of the state, with
+                the field names as returned by ``MowerState.replace_state``.
+            state: A state the poll starts from when nobody watches the mower
+                yet (used by ``MowerState.watch``).
+        """
+        key = str(mower_id)
+        hub = self._watch_hubs.get(key)
+        if hub is None:
+            hub = self._watch_hubs[key] = WatchHub(self, key, interval, state)
+        slot = hub.join(interval)
+        try:
+            while True:
+                changed = await slot.next()
+                if changed is None:
+                    return  # the client was closed
+                # Slots are only offered changes once a state is published.
+                state = hub.state
+                assert state is not None
+                yield (state, changed) if changes else state
+        finally:
+            hub.leave(slot)
+            if not hub and self._watch_hubs.get(key) is hub:
+                del self._watch_hubs[key]
+
     async def receive_mower_statistics(self, mower_id: Union[str, int]) -> dict:
         logger.debug("receive_mower_statistics: %s", mower_id)
-        stats = await self._request_json(
-            f"{IMOW_API_URI}/mowers/{mower_id}/statistic/", "GET"
+        stats = await self._cached_request_json(
+            "statistics", mower_id, f"{IMOW_API_URI}/mowers/{mower_id}/statistic/"
         )
         logger.debug(stats)
         return stats
@@ -986,16 +1703,14 @@ async def receive_mower_state_with_statistics(
     ) -> MowerState:
         """Return a mower's state with its statistics attached.
 
-        Fetches the mower state, waits briefly to avoid upstream timeouts, then
-        fetches the statistics and stores them on the returned ``MowerState`` as
-        ``statistics``. This keeps the pacing concern inside the library so
-        consumers can issue a single call.
+        Fetches the mower state, then the statistics, and stores them on the
+        returned ``MowerState`` as ``statistics``. Issuing the two requests
+        back-to-back can trigger upstream timeouts; the per-mower gap of
+        :attr:`pacer` spaces them out, but only when both actually hit the
+        network.
         """
         mower = await self.receive_mower_by_id(mower_id)
-        await asyncio.sleep(self._STATISTICS_FETCH_DELAY_SECONDS)
-        mower.__dict__["statistics"] = await self.receive_mower_statistics(
-            mower_id
-        )
+        mower.statistics = await self.receive_mower_statistics(mower_id)
         return mower
 
     async def receive_mower_week_mow_time_in_hours(
@@ -1011,8 +1726,10 @@ async def receive_mower_week_mow_time_in_hours(
 
     async def receive_mower_start_points(self, mower_id: Union[str, int]) -> list:
         logger.debug("receive_mower_start_points: %s", mower_id)
-        start_points = await self._request_json(
-            f"{IMOW_API_URI}/mowers/{mower_id}/start-points/", "GET"
+        start_points = await self._cached_request_json(
+            "start_points",
+            mower_id,
+            f"{IMOW_API_URI}/mowers/{mower_id}/start-points/",
         )
         for startpoint in start_points:
             logger.debug("  - %s", startpoint)
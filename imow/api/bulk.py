@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+# ``receive_many(include=...)`` names -> the IMowApi method reading each one.
+BULK_ENDPOINTS: Dict[str, str] = {
+    "state": "receive_mower_by_id",
+    "statistics": "receive_mower_statistics",
+    "week_mow_time": "receive_mower_week_mow_time_in_hours",
+    "start_points": "receive_mower_start_points",
+}
+
+
+class MowerResult:
+    """What :meth:`IMowApi.receive_many <imow.api.IMowApi.receive_many>` read
+    for one mower.
+
+    Each requested part is stored under its ``include`` name (``state`` is a
+    :class:`~imow.common.mowerstate.MowerState`); parts that were not requested
+    or failed are ``None``. ``errors`` maps the name of every failed part to
+    its exception.
+    """
+
+    __slots__ = (
+        "mower_id",
+        "state",
+        "statistics",
+        "week_mow_time",
+        "start_points",
+        "errors",
+    )
+
+    def __init__(self, mower_id: str) -> None:
+        self.mower_id = mower_id
+        self.state: Optional[Any] = None
+        self.statistics: Optional[dict] = None
+        self.week_mow_time: Optional[dict] = None
+        self.start_points: Optional[list] = None
+        self.errors: Dict[str, BaseException] = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether every requested part was read."""
+        return not self.errors
+
+    def __repr__(self) -> str:
+        failed = f" errors={sorted(self.errors)}" if self.errors else ""
+        return f"<MowerResult {self.mower_id}{failed}>"
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from imow.common.mowerstate import MowerState
+
+if TYPE_CHECKING:
+    from imow.api import IMowApi
+
+logger = logging.getLogger("imow")
+
+# Base seconds between two refreshes of one mower, per activity class.
+DEFAULT_INTERVALS: Dict[str, float] = {
+    "error": 30.0,
+    "active": 30.0,
+    "unknown": 120.0,
+    "idle": 600.0,
+}
+
+# Substrings of ``machineState`` (the upper-cased English status text). Active
+# keywords are checked first, so "DRIVING_TO_DOCK" counts as active.
+ACTIVE_STATE_KEYWORDS = ("MOW", "DRIV", "ON_THE_WAY", "RETURN", "HOME", "SEARCH")
+IDLE_STATE_KEYWORDS = ("DOCK", "CHARG", "IDLE", "STANDBY", "PARK", "SLEEP", "PAUS")
+
+# ``on_change(mower, changed_fields)``, called after a refresh changed a mower.
+ChangeHandler = Callable[[MowerState, FrozenSet[str]], Any]
+
+
+def classify(mower: MowerState) -> str:
+    """Return the activity class (a key of :data:`DEFAULT_INTERVALS`)."""
+    if mower.stateMessage["error"]:
+        return "error"
+    machine_state = mower.machineState or ""
+    if any(keyword in machine_state for keyword in ACTIVE_STATE_KEYWORDS):
+        return "active"
+    if any(keyword in machine_state for keyword in IDLE_STATE_KEYWORDS):
+        return "idle"
+    return "unknown"
+
+
+class _Tracked:
+    """Schedule of one mower: its state, when it is due and how calm it is."""
+
+    __slots__ = ("api", "state", "due", "unchanged")
+
+    def __init__(self, api: "IMowApi", state: MowerState, due: float) -> None:
+        self.api = api
+        self.state = state
+        self.due = due
+        # Consecutive refreshes that changed nothing; drives the back-off.
+        self.unchanged = 0
+
+
+class FleetPoller:
+    """Keep the mowers of several accounts fresh with adaptive intervals.
+
+    Each mower is refreshed on its own schedule: every ``intervals["error"]``
+    or ``intervals["active"]`` seconds while it reports an error or is mowing /
+    on its way, every ``intervals["idle"]`` seconds while docked or charging,
+    and every ``intervals["unknown"]`` seconds otherwise. Each refresh that
+    changes nothing multiplies the interval by ``backoff`` (up to
+    ``max_interval``); any change resets it. Every interval is spread by
+    ``±jitter`` so mowers don't line up.
+
+    Per pass, all due mowers of one client are refreshed with a single
+    ``receive_mowers()`` if more than one is due, otherwise with
+    ``receive_mower_by_id()``. At most ``max_concurrency`` requests run at the
+    same time, and at most ``budget`` requests are issued per ``budget_window``
+    seconds; due mowers beyond that wait for the next window.
+
+    Mowers missing from a ``receive_mowers()`` answer are no longer polled.
+    The poller keeps one :class:`MowerState` per mower (see :attr:`states`) and
+    updates it in place with ``replace_state``, so ``MowerState.subscribe``
+    callbacks fire; ``on_change`` is called for every mower that changed.
+
+    Args:
+        clients: The accounts to poll; more can be added with :meth:`add_client`.
+        intervals: Overrides merged over :data:`DEFAULT_INTERVALS`.
+        backoff: Interval multiplier per refresh without changes.
+        max_interval: Upper bound for backed-off intervals in seconds.
+        jitter: Relative spread applied to every interval (``0.1`` = ±10%).
+        max_concurrency: Requests in flight at most, across all clients.
+        budget: Requests allowed per ``budget_window`` seconds.
+        budget_window: Length of a budget window in seconds.
+        on_change: Called as ``on_change(mower, changed_fields)``.
+        clock: Monotonic time source (injectable for tests).
+        sleep: Coroutine used to wait between passes (injectable for tests).
+        rng: Returns a float in ``[0, 1)`` for the jitter (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        clients: Iterable["IMowApi"] = (),
+        intervals: Optional[Mapping[str, float]] = None,
+        backoff: float = 1.5,
+        max_interval: float = 1800.0,
+        jitter: float = 0.1,
+        max_concurrency: int = 4,
+        budget: int = 60,
+        budget_window: float = 60.0,
+        on_change: Optional[ChangeHandler] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.intervals: Dict[str, float] = dict(DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.budget = budget
+        self.budget_window = budget_window
+        self.on_change = on_change
+        self.requests = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._clients: List["IMowApi"] = []
+        # Clients whose mowers are not known yet -> when to list them (again).
+        self._undiscovered: Dict["IMowApi", float] = {}
+        self._tracked: Dict[Tuple["IMowApi", str], _Tracked] = {}
+        self._window_start = clock()
+        self._window_used = 0
+        self._task: Optional[asyncio.Task] = None
+        for api in clients:
+            self.add_client(api)
+
+    @property
+    def states(self) -> Dict[str, MowerState]:
+        """The latest state of every known mower, by mower id."""
+        return {str(t.state.id): t.state for t in self._tracked.values()}
+
+    def add_client(self, api: "IMowApi") -> None:
+        """Start polling the mowers of ``api`` (discovered on the next pass)."""
+        if api not in self._clients:
+            self._clients.append(api)
+            self._undiscovered[api] = self._clock()
+
+    def remove_client(self, api: "IMowApi") -> None:
+        """Stop polling the mowers of ``api``."""
+        if api in self._clients:
+            self._clients.remove(api)
+        self._undiscovered.pop(api, None)
+        for key in [k for k, t in self._tracked.items() if t.api is api]:
+            del self._tracked[key]
+
+    def next_due(self) -> Optional[float]:
+        """Clock time of the next scheduled refresh (``None``: nothing known)."""
+        times = [*self._undiscovered.values(), *(t.due for t in self._tracked.values())]
+        return min(times) if times else None
+
+    def interval(self, mower: MowerState, unchanged: int = 0) -> float:
+        """Seconds until ``mower`` is refreshed again, before jitter."""
+        base = self.intervals[classify(mower)]
+        cap = max(base, self.max_interval)
+        try:
+            return min(base * self.backoff**unchanged, cap)
+        except OverflowError:
+            return cap
+
+    async def poll_once(self) -> int:
+        """Refresh everything that is due now; returns the requests issued."""
+        now = self._clock()
+        batches: List[Tuple["IMowApi", List[_Tracked]]] = [
+            (api, []) for api, at in self._undiscovered.items() if at <= now
+        ]
+        due: Dict["IMowApi", List[_Tracked]] = {}
+        for tracked in self._tracked.values():
+            if tracked.due <= now:
+                due.setdefault(tracked.api, []).append(tracked)
+        batches.extend(due.items())
+
+        issued = await asyncio.gather(
+            *(self._refresh(api, entries) for api, entries in batches)
+        )
+        return sum(issued)
+
+    async def run(self) -> None:
+        """Poll until cancelled, sleeping until the next refresh is due."""
+        while True:
+            await self.poll_once()
+            now = self._clock()
+            wake_at = self.next_due()
+            if wake_at is None:
+                wake_at = now + self.intervals["unknown"]
+            if self._window_used >= self.budget:
+                wake_at = max(wake_at, self._window_start + self.budget_window)
+            await self._sleep(max(wake_at - now, 1.0))
+
+    def start(self) -> "asyncio.Task[None]":
+        """Run :meth:`run` in a background task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel the background task started by :meth:`start`."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _take_budget(self) -> bool:
+        now = self._clock()
+        if now - self._window_start >= self.budget_window:
+            self._window_start = now
+            self._window_used = 0
+        if self._window_used >= self.budget:
+            return False
+        self._window_used += 1
+        return True
+
+    def _schedule(self, tracked: _Tracked) -> None:
+        spread = 1 + self.jitter * (2 * self._rng() - 1)
+        interval = self.interval(tracked.state, tracked.unchanged)
+        tracked.due = self._clock() + interval * spread
+
+    async def _refresh(self, api: "IMowApi", entries: List[_Tracked]) -> int:
+        """Refresh ``entries`` of one client (all of its mowers if empty)."""
+        if not self._take_budget():
+            logger.debug("Poll budget exhausted; deferring refresh")
+            return 0
+        try:
+            async with self._semaphore:
+                if len(entries) == 1:
+                    fresh = [await api.receive_mower_by_id(entries[0].state.id)]
+                else:
+                    fresh = await api.receive_mowers()
+        except Exception as err:
+            logger.warning("Fleet poll failed: %s", err)
+            if api in self._undiscovered:
+                self._undiscovered[api] = self._clock() + self.intervals["unknown"]
+            for tracked in entries:
+                self._schedule(tracked)
+            return 1
+        finally:
+            self.requests += 1
+        self._undiscovered.pop(api, None)
+        if len(entries) != 1:
+            # The full list: mowers missing from it left the account.
+            listed = {(api, str(mower.id)) for mower in fresh}
+            for key in [k for k in self._tracked if k[0] is api and k not in listed]:
+                del self._tracked[key]
+        for mower in fresh:
+            try:
+                self._update(api, mower)
+            except Exception:
+                # One unexpected payload must not stop polling the others.
+                logger.exception("FleetPoller could not update mower %s", mower.id)
+                failed = self._tracked.get((api, str(mower.id)))
+                if failed is not None:
+                    failed.due = self._clock() + self.intervals["unknown"]
+        return 1
+
+    def _update(self, api: "IMowApi", mower: MowerState) -> None:
+        key = (api, str(mower.id))
+        tracked = self._tracked.get(key)
+        if tracked is None:
+            tracked = self._tracked[key] = _Tracked(api, mower, self._clock())
+            self._schedule(tracked)
+            return
+        if mower is tracked.state:
+            changed: FrozenSet[str] = frozenset()
+        else:
+            changed = tracked.state.replace_state(mower.as_dict())
+        if changed:
+            tracked.unchanged = 0
+        elif self.interval(tracked.state, tracked.unchanged) < self.max_interval:
+            # Counting on once fully backed off would only grow the exponent.
+            tracked.unchanged += 1
+        self._schedule(tracked)
+        if changed and self.on_change is not None:
+            try:
+                self.on_change(tracked.state, changed)
+            except Exception:
+                logger.exception("FleetPoller on_change callback failed")
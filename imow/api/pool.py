@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import aiohttp
+
+from imow.api import IMowApi, _build_connector
+from imow.common.digestcache import PayloadDigestCache
+from imow.common.pacing import RequestPacer
+from imow.common.responsecache import ResponseCache
+from imow.common.validatorcache import ValidatorCache
+
+logger = logging.getLogger("imow")
+
+# IMowApi options keyed by URL or endpoint only: one instance shared between
+# accounts would hand one account's data to another.
+_PER_ACCOUNT_OPTIONS = frozenset(
+    {"response_cache", "payload_digests", "validator_cache"}
+)
+
+
+class IMowClientPool:
+    """Run many accounts over one shared connection pool.
+
+    Every account gets its own :class:`IMowApi` with its own
+    ``ClientSession``, so each has an isolated cookie jar (a login clearing the
+    STIHL cookies only affects that account) and its own auth lock. All of
+    those sessions borrow one ``TCPConnector``: sockets, the DNS cache and TLS
+    connections are shared, and ``limit``/``limit_per_host`` cap the open
+    connections for the whole pool instead of per account. They also share one
+    :class:`~imow.common.pacing.RequestPacer`, so its per-host ``rate`` and
+    ``burst`` hold for the whole pool; the ``mower_gap`` still applies per
+    mower. Message tables are shared process-wide already (see
+    :mod:`imow.common.i18n`).
+
+    Accounts are added with :meth:`add_account`, which must be called while
+    the event loop is running. :meth:`close` (or leaving ``async with``) closes
+    every account and then the connector.
+
+    Args:
+        limit: Connections open at most, across all accounts and hosts.
+        limit_per_host: Connections open at most per host.
+        ttl_dns_cache: Seconds a resolved host name is reused.
+        keepalive_timeout: Seconds an idle connection is kept for reuse.
+        response_cache_factory: Builds each account's ``response_cache``.
+        payload_digests_factory: Builds each account's ``payload_digests``.
+        validator_cache_factory: Builds each account's ``validator_cache``.
+        pacer: The pacer shared by all accounts (default: ``RequestPacer()``).
+        **api_defaults: Keyword arguments passed to every :class:`IMowApi`
+            (``add_account`` arguments take precedence).
+
+    Raises:
+        ValueError: ``api_defaults`` holds ``response_cache``,
+            ``payload_digests`` or ``validator_cache``; these hold per-account
+            data, so pass the matching ``*_factory`` instead.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30.0,
+        response_cache_factory: Optional[Callable[[], ResponseCache]] = None,
+        payload_digests_factory: Optional[Callable[[], PayloadDigestCache]] = None,
+        validator_cache_factory: Optional[Callable[[], ValidatorCache]] = None,
+        pacer: Optional[RequestPacer] = None,
+        **api_defaults: Any,
+    ) -> None:
+        shared = sorted(_PER_ACCOUNT_OPTIONS & set(api_defaults))
+        if shared:
+            raise ValueError(
+                f"{shared} hold per-account data and cannot be shared by the pool; "
+                f"pass {[f'{name}_factory' for name in shared]} instead"
+            )
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.api_defaults = api_defaults
+        self.pacer: RequestPacer = pacer if pacer is not None else RequestPacer()
+        self._factories: Dict[str, Callable[[], Any]] = {
+            name: factory
+            for name, factory in (
+                ("response_cache", response_cache_factory),
+                ("payload_digests", payload_digests_factory),
+                ("validator_cache", validator_cache_factory),
+            )
+            if factory is not None
+        }
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._clients: Dict[str, IMowApi] = {}
+
+    async def __aenter__(self) -> "IMowClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._clients
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._clients))
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """The connector shared by all accounts (created on first use)."""
+        if self._connector is None or self._connector.closed:
+            self._connector = _build_connector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+        return self._connector
+
+    def add_account(
+        self,
+        key: str,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+        **kwargs: Any,
+    ) -> IMowApi:
+        """Create the client for account ``key`` and return it.
+
+        Raises:
+            ValueError: An account with this key is already in the pool.
+        """
+        if key in self._clients:
+            raise ValueError(f"Account {key!r} is already in the pool")
+        session = aiohttp.ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(),
+            raise_for_status=True,
+        )
+        per_account = {name: factory() for name, factory in self._factories.items()}
+        api = IMowApi(
+            email=email,
+            password=password,
+            token=token,
+            aiohttp_session=session,
+            **{"pacer": self.pacer, **self.api_defaults, **per_account, **kwargs},
+        )
+        self._clients[key] = api
+        return api
+
+    def get(self, key: str) -> IMowApi:
+        """Return the client of account ``key`` (``KeyError`` if unknown)."""
+        return self._clients[key]
+
+    async def remove_account(self, key: str) -> None:
+        """Close and forget the client of account ``key``, if any."""
+        api = self._clients.pop(key, None)
+        if api is not None:
+            await self._close_client(api)
+
+    async def close(self) -> None:
+        """Close every account, then the shared connector."""
+        clients, self._clients = list(self._clients.values()), {}
+        results = await asyncio.gather(
+            *(self._close_client(api) for api in clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Closing a pooled client failed: %s", result)
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return :meth:`IMowApi.stats` of every account, by key."""
+        return {key: api.stats() for key, api in self._clients.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of accounts and their summed request counters."""
+        clients = self._clients.values()
+        return {
+            "accounts": len(self._clients),
+            "requests": sum(api.requests_sent for api in clients),
+            "errors": sum(api.request_errors for api in clients),
+        }
+
+    @staticmethod
+    async def _close_client(api: IMowApi) -> None:
+        # The session is injected, so ``IMowApi.close`` leaves it open; it only
+        # borrows the connector, so closing it keeps the other accounts' sockets.
+        await api.close()
+        if api.http_session is not None and not api.http_session.closed:
+            await api.http_session.close()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, FrozenSet, Optional, Set
+
+from imow.common.mowerstate import MowerState
+
+if TYPE_CHECKING:
+    from imow.api import IMowApi
+
+logger = logging.getLogger("imow")
+
+
+class WatchSlot:
+    """One watcher's mailbox: only the latest state matters.
+
+    Change sets that arrive while the watcher is still busy are merged, so a
+    slow consumer never falls behind; it sees the newest state with every field
+    that changed since it last looked.
+    """
+
+    __slots__ = ("_pending", "_ready", "_closed")
+
+    def __init__(self) -> None:
+        self._pending: Optional[FrozenSet[str]] = None
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def offer(self, changed: FrozenSet[str]) -> None:
+        self._pending = changed if self._pending is None else self._pending | changed
+        self._ready.set()
+
+    def close(self) -> None:
+        """Wake the watcher for good: :meth:`next` returns ``None`` from now on."""
+        self._closed = True
+        self._ready.set()
+
+    async def next(self) -> Optional[FrozenSet[str]]:
+        """Wait for and take the merged change set (``None``: closed)."""
+        await self._ready.wait()
+        if self._closed:
+            return None
+        self._ready.clear()
+        changed, self._pending = self._pending or frozenset(), None
+        return changed
+
+
+class WatchHub:
+    """Polls one mower on behalf of all of its watchers.
+
+    The poll task runs while at least one watcher is joined and is cancelled
+    when the last one leaves. Every poll is merged into one shared
+    :class:`MowerState` with ``replace_state``; watchers are only notified when
+    that reported changes. The poll interval is the shortest one asked for by
+    the current watchers.
+    """
+
+    def __init__(
+        self,
+        api: "IMowApi",
+        mower_id: str,
+        interval: float,
+        state: Optional[MowerState] = None,
+    ) -> None:
+        self.api = api
+        self.mower_id = mower_id
+        self.interval = interval
+        self.state = state
+        self._slots: Set[WatchSlot] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def join(self, interval: float) -> WatchSlot:
+        """Register a watcher; it first receives the current state, if any."""
+        slot = WatchSlot()
+        self._slots.add(slot)
+        self.interval = min(self.interval, interval)
+        if self.state is not None:
+            slot.offer(_all_fields(self.state))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._poll())
+        return slot
+
+    def leave(self, slot: WatchSlot) -> None:
+        """Unregister a watcher; the last one to leave stops the poll."""
+        self._slots.discard(slot)
+        if not self._slots:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Stop polling and close the slots, so every watcher stops."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        for slot in self._slots:
+            slot.close()
+
+    async def _poll(self) -> None:
+        # The first watcher may have supplied a state: wait before the first poll.
+        if self.state is not None:
+            await asyncio.sleep(self.interval)
+        while True:
+            try:
+                fresh = await self.api.receive_mower_by_id(self.mower_id)
+            except Exception as err:
+                logger.warning("Watching mower %s failed: %s", self.mower_id, err)
+            else:
+                self._publish(fresh)
+            await asyncio.sleep(self.interval)
+
+    def _publish(self, fresh: MowerState) -> None:
+        if self.state is None:
+            self.state = fresh
+            changed = _all_fields(fresh)
+        elif fresh is self.state:
+            return
+        else:
+            changed = self.state.replace_state(fresh.as_dict())
+        if changed:
+            for slot in list(self._slots):
+                slot.offer(changed)
+
+
+def _all_fields(state: MowerState) -> FrozenSet[str]:
+    """The change set reported for a state a watcher has not seen yet."""
+    fields = state.as_dict()
+    status = fields.get("status")
+    nested = [f"status.{key}" for key in status] if isinstance(status, dict) else []
+    return frozenset([*fields, *nested])
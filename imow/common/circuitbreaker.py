@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while the upstream is down instead of hammering it.
+
+    - **closed**: requests flow; ``failure_threshold`` consecutive failures
+      (5xx responses or connection errors) open the circuit.
+    - **open**: requests are rejected without touching the network until
+      ``recovery_timeout`` seconds have passed.
+    - **half-open**: a single trial request is let through; success closes the
+      circuit, failure opens it again. If the trial never reports back, another
+      one is allowed after ``recovery_timeout``, so recovery is probed at most
+      once per timeout.
+
+    The breaker also caches the last maintenance-probe result for
+    ``maintenance_ttl`` seconds; a result reporting an outage opens the circuit
+    immediately.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_timeout: Seconds to stay open before a trial request.
+        maintenance_ttl: Seconds a maintenance-probe result stays valid.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        maintenance_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.maintenance_ttl = maintenance_ttl
+        self._clock = clock
+        self.state: str = CLOSED
+        self.failures = 0
+        # When the circuit (re)opened or the last trial was let through.
+        self._opened_at = 0.0
+        self._maintenance: Optional[Dict[str, Any]] = None
+        self._maintenance_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now (takes the trial slot if any)."""
+        if self.state == CLOSED:
+            return True
+        if self._clock() - self._opened_at < self.recovery_timeout:
+            return False
+        self.state = HALF_OPEN
+        self._opened_at = self._clock()
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial request will be allowed."""
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - self._clock())
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self) -> None:
+        """Open the circuit now; an open circuit keeps its recovery time.
+
+        Failures of requests that were sent before the circuit opened (or
+        reported late) must not postpone the trial request indefinitely.
+        """
+        if self.state == OPEN:
+            return
+        self.state = OPEN
+        self._opened_at = self._clock()
+
+    def cached_maintenance(self) -> Optional[Dict[str, Any]]:
+        """Return the last maintenance-probe result while it is still valid."""
+        if self._maintenance is None:
+            return None
+        if self._clock() - self._maintenance_at >= self.maintenance_ttl:
+            return None
+        return self._maintenance
+
+    def record_maintenance(self, status: Dict[str, Any]) -> None:
+        """Cache a maintenance-probe result; an outage opens the circuit."""
+        self._maintenance = status
+        self._maintenance_at = self._clock()
+        if status.get("serverDisrupted") or status.get("serverDown"):
+            self.trip()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from imow.common.lrucache import LRUCache
+
+# 16 bytes of BLAKE2b are plenty to tell two bodies of the same URL apart.
+_DIGEST_SIZE = 16
+
+
+def _digest(body: bytes) -> bytes:
+    return hashlib.blake2b(body, digest_size=_DIGEST_SIZE).digest()
+
+
+class PayloadDigestCache(LRUCache[Hashable, Tuple[Any, Any]]):
+    """Reuse parsed bodies for byte-identical responses.
+
+    Keeps a digest of the last raw body per key (the request URL, which
+    identifies both endpoint and mower) together with its parsed JSON. When the
+    next body has the same digest, :meth:`parse` returns the previous object
+    instead of decoding again. Objects built from a parsed body (such as a
+    ``MowerState``) can be reused the same way with :meth:`derive`, which
+    rebuilds them only when it is given a different parsed object.
+
+    ``hits``/``misses`` count bodies whose decode was skipped/done, ``reused``
+    the derived objects handed out again.
+
+    Args:
+        max_entries: Upper bound on the number of bodies, and separately on
+            the number of derived objects.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        super().__init__(max_entries)
+        self.reused = 0
+        # Key -> (parsed body, object derived from it); the bodies are in
+        # ``_entries`` as (digest, parsed body).
+        self._derived: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+
+    def parse(self, key: Hashable, body: bytes) -> Any:
+        """Return ``body`` parsed as JSON, reusing the last result for ``key``.
+
+        Like ``aiohttp``'s ``json()``, an empty body parses to ``None``.
+        """
+        digest = _digest(body)
+        entry = self._recall(key)
+        if entry is not None and entry[0] == digest:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        parsed = json.loads(body) if body.strip() else None
+        self._remember(key, (digest, parsed))
+        return parsed
+
+    def derive(self, key: Hashable, parsed: Any, factory: Callable[[Any], Any]) -> Any:
+        """Return ``factory(parsed)``, reused while ``parsed`` is the same object."""
+        entry = self._recall(key, self._derived)
+        if entry is not None and entry[0] is parsed:
+            self.reused += 1
+            return entry[1]
+        value = factory(parsed)
+        self._remember(key, (parsed, value), self._derived)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """Forget the body and the derived object stored under ``key``."""
+        self._entries.pop(key, None)
+        self._derived.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every body and derived object (counters are kept)."""
+        super().clear()
+        self._derived.clear()
+
+    def _counters(self) -> Dict[str, int]:
+        return {**super()._counters(), "reused": self.reused}
@@ -20,3 +20,7 @@ class MessageNotFoundError(IMowError):
 
 class LanguageNotFoundError(IMowError):
     pass
+
+
+class ClientClosingError(IMowError):
+    pass
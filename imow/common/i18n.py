@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from aiohttp import ClientConnectionError, ClientResponseError, ClientSession
+
+from imow.common.atomicfile import write_json_atomic
+from imow.common.consts import IMOW_I18N_BASE_URI
+from imow.common.exceptions import LanguageNotFoundError
+from imow.common.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from imow.common.messages import Messages
+
+logger = logging.getLogger("imow")
+
+
+class MessagesRegistry:
+    """Process-wide cache of :class:`~imow.common.messages.Messages` per language.
+
+    Each language file is downloaded once per registry and the resulting
+    ``Messages`` instance is shared by every client; concurrent requests for a
+    language that is still loading wait for the same download. ``Messages``
+    instances are never mutated after construction, so sharing them is safe.
+    Failed downloads are not cached.
+
+    With a ``cache_dir``, downloaded files are also kept on disk together with
+    their ``ETag``/``Last-Modified`` validators. A later process then loads
+    them from disk without waiting for the network and revalidates them in
+    the background with a conditional GET: a ``304`` keeps the loaded tables
+    as they are, a ``200`` replaces them for clients loading messages from
+    then on.
+
+    Args:
+        cache_dir: Directory for the on-disk cache (``None`` disables it).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir
+        self._messages: Dict[str, "Messages"] = {}
+        self._flights = SingleFlight()
+        # Background revalidation tasks (kept alive until they finish) and the
+        # session each one uses.
+        self._revalidations: Dict["asyncio.Task[None]", ClientSession] = {}
+
+    def __contains__(self, lang: str) -> bool:
+        return lang in self._messages
+
+    async def get(self, session: ClientSession, lang: str) -> "Messages":
+        """Return the messages for ``lang``, loading them on first use.
+
+        Raises:
+            LanguageNotFoundError: If the language file does not exist.
+            aiohttp.ClientResponseError: For any other HTTP error.
+        """
+        messages = self._messages.get(lang)
+        if messages is None:
+            messages = await self._flights.do(lang, lambda: self._load(session, lang))
+        return messages
+
+    async def fetch_raw(self, session: ClientSession, lang: str) -> Dict[str, Any]:
+        """Return the complete language file for ``lang``.
+
+        ``Messages`` only keeps the texts it resolves; use this for any other
+        key. With a disk cache the download is a conditional GET: a ``304``
+        returns the cached file, a ``200`` also replaces it on disk, and the
+        cached file is returned as well if the server cannot be reached. The
+        result is not kept in memory by the registry.
+
+        Raises:
+            LanguageNotFoundError: If the language file does not exist.
+            aiohttp.ClientResponseError: For any other HTTP error.
+        """
+        cached = await self._read_disk(lang)
+        try:
+            entry = await self._download(session, lang, cached)
+        except (ClientConnectionError, asyncio.TimeoutError) as err:
+            if cached is None:
+                raise
+            logger.warning("Using cached i18n file %r: %s", lang, err)
+            return cached["i18n"]
+        if entry is not None:
+            await self._write_disk(lang, entry)
+            return entry["i18n"]
+        if cached is None:
+            # Unreachable: an unconditional GET never answers 304.
+            raise RuntimeError(f"Unexpected 304 for i18n file {lang!r}")
+        return cached["i18n"]
+
+    async def wait_revalidations(
+        self, session: Optional[ClientSession] = None, timeout: float = 10.0
+    ) -> None:
+        """Wait for the background revalidations using ``session`` (or all).
+
+        Call this before closing the session, so a short-lived process still
+        refreshes its disk copy. Revalidations still running after ``timeout``
+        seconds are cancelled.
+        """
+        tasks = [
+            task
+            for task, used in self._revalidations.items()
+            if session is None or used is session
+        ]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def clear(self) -> None:
+        """Forget every language held in memory (the disk cache is kept)."""
+        self._messages.clear()
+
+    async def _load(self, session: ClientSession, lang: str) -> "Messages":
+        # The message catalogue is large; load it only once i18n is needed.
+        from imow.common.messages import Messages
+
+        cached = await self._read_disk(lang)
+        if cached is not None:
+            messages = Messages(cached["i18n"])
+            self._messages[lang] = messages
+            task = asyncio.ensure_future(self._revalidate(session, lang, cached))
+            self._revalidations[task] = session
+            task.add_done_callback(lambda done: self._revalidations.pop(done, None))
+            return messages
+
+        entry = await self._download(session, lang)
+        if entry is None:
+            # Unreachable: an unconditional GET never answers 304.
+            raise RuntimeError(f"Unexpected 304 for i18n file {lang!r}")
+        messages = Messages(entry["i18n"])
+        self._messages[lang] = messages
+        await self._write_disk(lang, entry)
+        return messages
+
+    async def _revalidate(
+        self, session: ClientSession, lang: str, cached: Dict[str, Any]
+    ) -> None:
+        from imow.common.messages import Messages
+
+        try:
+            entry = await self._download(session, lang, cached)
+        except Exception as err:
+            logger.warning("Could not revalidate i18n file %r: %s", lang, err)
+            return
+        if entry is None:
+            logger.debug("i18n file %r is unchanged (304)", lang)
+            return
+        logger.debug("i18n file %r changed upstream, reloading", lang)
+        self._messages[lang] = Messages(entry["i18n"])
+        await self._write_disk(lang, entry)
+
+    async def _download(
+        self,
+        session: ClientSession,
+        lang: str,
+        cached: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """GET the language file; ``None`` if ``cached`` is still current."""
+        url = f"{IMOW_I18N_BASE_URI}/{lang}.json"
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            async with session.request("GET", url, headers=headers) as response:
+                response.raise_for_status()
+                if response.status == 304:
+                    return None
+                return {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "i18n": await response.json(content_type=None),
+                }
+        except ClientResponseError as e:
+            if e.status == 404:
+                raise LanguageNotFoundError(
+                    f"Language-File '{lang}.json' not found on imow upstream ({url})"
+                ) from e
+            raise
+
+    def _disk_path(self, lang: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(os.path.expanduser(self.cache_dir), f"i18n-{lang}.json")
+
+    async def _read_disk(self, lang: str) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(lang)
+        if path is None:
+            return None
+
+        def read() -> Optional[Dict[str, Any]]:
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    entry = json.load(handle)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as err:
+                logger.warning("Ignoring unreadable i18n cache %s: %s", path, err)
+                return None
+            if not isinstance(entry, dict) or not isinstance(entry.get("i18n"), dict):
+                return None
+            return entry
+
+        return await asyncio.to_thread(read)
+
+    async def _write_disk(self, lang: str, entry: Dict[str, Any]) -> None:
+        path = self._disk_path(lang)
+        if path is None:
+            return
+        try:
+            await asyncio.to_thread(write_json_atomic, path, entry)
+        except OSError as err:
+            logger.warning("Could not write i18n cache %s: %s", path, err)
+
+
+# Shared by every IMowApi that is not given its own registry. Set its
+# ``cache_dir`` to keep the language files on disk between runs.
+default_registry = MessagesRegistry()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# Characters fed to the tokenizer per step; parsing stops after the step in
+# which both fields were found, so the rest of the page is never tokenized.
+_CHUNK_SIZE = 4096
+
+
+class _FieldsFound(Exception):
+    """Raised from inside the tokenizer to stop parsing early."""
+
+
+class LoginFormExtractor(HTMLParser):
+    """Pull the csrf-token and requestId out of the STIHL login page.
+
+    Built on the stdlib tokenizer rather than a full DOM: only start tags are
+    inspected and parsing stops as soon as the hidden ``csrf-token`` and
+    ``requestId`` inputs have been seen. The first matching element wins, like
+    a DOM ``find``. When the hidden csrf input is missing or empty, the
+    ``<meta name="csrf-token">`` content is used instead.
+
+    ``spa_shell`` records whether the page contained the ``<stihl-imow-root>``
+    element of the already-authenticated SPA; it is only reliable when the
+    fields were not found (i.e. the whole page was parsed).
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.spa_shell = False
+        self._input_csrf: Optional[str] = None
+        self._meta_csrf: Optional[str] = None
+        self._request_id: Optional[str] = None
+        self._seen_input_csrf = False
+        self._seen_request_id = False
+
+    @property
+    def csrf_token(self) -> Optional[str]:
+        return self._input_csrf or self._meta_csrf or None
+
+    @property
+    def request_id(self) -> Optional[str]:
+        return self._request_id or None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "input":
+            attributes = dict(attrs)
+            name = attributes.get("name")
+            if name == "csrf-token" and not self._seen_input_csrf:
+                self._seen_input_csrf = True
+                self._input_csrf = attributes.get("value")
+            elif name == "requestId" and not self._seen_request_id:
+                self._seen_request_id = True
+                self._request_id = attributes.get("value")
+        elif tag == "meta" and self._meta_csrf is None:
+            attributes = dict(attrs)
+            if attributes.get("name") == "csrf-token":
+                self._meta_csrf = attributes.get("content") or None
+        elif tag == "stihl-imow-root":
+            self.spa_shell = True
+            return
+        else:
+            return
+        if self._seen_input_csrf and self._seen_request_id and self.csrf_token:
+            raise _FieldsFound
+
+    def extract(self, html: str) -> "LoginFormExtractor":
+        """Parse ``html`` until both fields are known; returns ``self``."""
+        try:
+            for start in range(0, len(html), _CHUNK_SIZE):
+                self.feed(html[start : start + _CHUNK_SIZE])
+            self.close()
+        except _FieldsFound:
+            pass
+        return self
+
+
+def extract_login_form(html: str) -> LoginFormExtractor:
+    """Return a :class:`LoginFormExtractor` that has parsed ``html``."""
+    return LoginFormExtractor().extract(html)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Base of the client's bounded in-memory caches.
+
+    Entries live in ordered dicts, least recently used first: :meth:`_recall`
+    moves a key it finds to the end and :meth:`_remember` stores one there,
+    evicting from the front while more than ``max_entries`` are kept.
+    Subclasses with a second table pass it as ``entries``. Values are handed
+    out as stored, so callers share them and must treat them as read-only.
+
+    ``hits`` and ``misses`` are counted by the subclasses; :meth:`stats`
+    reports them (plus any counters a subclass adds in :meth:`_counters`) and
+    the number of entries.
+
+    Args:
+        max_entries: Upper bound on the number of entries per table.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _recall(
+        self, key: K, entries: "Optional[OrderedDict[K, V]]" = None
+    ) -> Optional[V]:
+        """Return the entry stored under ``key`` (``None`` if there is none)."""
+        entries = self._entries if entries is None else entries
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+        return entry
+
+    def _remember(
+        self,
+        key: K,
+        entry: V,
+        entries: "Optional[OrderedDict[K, V]]" = None,
+    ) -> None:
+        """Store ``entry`` under ``key``, evicting the least recently used."""
+        entries = self._entries if entries is None else entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters and the current number of entries."""
+        return {**self._counters(), "entries": len(self)}
+
+    def _counters(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+# Payload fields a mower can be looked up by.
+INDEXED_FIELDS = ("id", "name", "externalId")
+
+
+class MowerIdentity:
+    """The identifying fields of one mower: ``id``, ``name`` and ``externalId``."""
+
+    __slots__ = ("id", "name", "externalId")
+
+    def __init__(self, mower_id: str, name: str, external_id: str) -> None:
+        self.id = mower_id
+        self.name = name
+        self.externalId = external_id
+
+    def __repr__(self) -> str:
+        return (
+            f"MowerIdentity(id={self.id!r}, name={self.name!r}, "
+            f"externalId={self.externalId!r})"
+        )
+
+
+class MowerIndex:
+    """Index of an account's mowers by id, name and externalId.
+
+    Filled from ``/mowers/`` list payloads. The whole index expires after
+    ``ttl`` seconds; an expired index answers every lookup with ``None`` so the
+    caller refreshes it from upstream.
+
+    Args:
+        ttl: Seconds a filled index stays valid.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self, ttl: float = 3600, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._filled_at: Optional[float] = None
+        self._by_field: Dict[str, Dict[str, MowerIdentity]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self._by_field["id"])
+
+    def update(self, payloads: Iterable[dict]) -> None:
+        """Replace the index with the mowers of a full ``/mowers/`` payload."""
+        by_field: Dict[str, Dict[str, MowerIdentity]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        for payload in payloads:
+            identity = MowerIdentity(
+                str(payload.get("id", "")),
+                str(payload.get("name", "")),
+                str(payload.get("externalId", "")),
+            )
+            for field in INDEXED_FIELDS:
+                by_field[field][getattr(identity, field)] = identity
+        self._by_field = by_field
+        self._filled_at = self._clock()
+
+    def is_fresh(self) -> bool:
+        return (
+            self._filled_at is not None and self._clock() - self._filled_at < self.ttl
+        )
+
+    def lookup(self, field: str, value: object) -> Optional[MowerIdentity]:
+        """Return the mower whose ``field`` equals ``value``, or ``None``.
+
+        ``None`` means either "unknown" or "index expired"; both warrant a
+        refresh.
+        """
+        if not self.is_fresh():
+            return None
+        return self._by_field[field].get(str(value))
+
+    def invalidate(self) -> None:
+        self._filled_at = None
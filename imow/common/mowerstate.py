@@ -1,7 +1,20 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import sys
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from imow.common.actions import IMowActions
 from imow.common.exceptions import MessageNotFoundError
@@ -17,6 +30,17 @@
     {"imow", "stateMessage", "machineError", "machineState"}
 )
 
+# ``stateMessage`` until a status has been resolved; shared by all instances.
+_EMPTY_STATE_MESSAGE: Mapping[str, Any] = MappingProxyType(
+    {"short": "", "long": "", "legacyMessage": "", "errorId": "", "error": False}
+)
+
+# Marks a field that was not set before (``None`` is a valid upstream value).
+_MISSING = object()
+
+# ``callback(mower, changed_fields)`` registered with ``MowerState.subscribe``.
+ChangeCallback = Callable[["MowerState", FrozenSet[str]], Any]
+
 # Value used for ``machineState`` when the upstream status code is unknown, so a
 # single new firmware code does not break the whole poll.
 _UNKNOWN_MACHINE_STATE = "UNKNOWN"
@@ -32,7 +56,16 @@ class MowerState:
 
     The declarations below are **annotation-only** (no runtime value): they
     document the known payload fields and give type checkers/IDEs an interface,
-    without creating misleading class-level defaults.
+    without creating misleading class-level defaults. Each of them is stored in
+    a slot; keys the upstream adds later (and attributes set by callers, such
+    as ``statistics``) go to a small overflow dict, so instances have no
+    ``__dict__``. Use :meth:`as_dict` to get the fields as a dict.
+
+    ``stateMessage``, ``machineError`` and ``machineState`` are derived from
+    ``status`` on first access and memoized until the status codes (or the
+    client's message tables) change, so refreshes that leave the state as it
+    was do no message resolution. ``stateMessage`` is a read-only mapping
+    shared by all mowers in the same state.
     """
 
     # --- Known upstream payload fields (populated dynamically) --------------
@@ -77,36 +110,229 @@ class MowerState:
     unitFormat: int
     version: str
 
+    # --- Internal slots -----------------------------------------------------
+    imow: "IMowApi"
+    # Keys outside ``FIELDS``, created on first use.
+    _extra: Optional[Dict[str, Any]]
+    # ``(field, callback)`` pairs registered with :meth:`subscribe`.
+    _subscribers: Optional[List[Tuple[Optional[str], ChangeCallback]]]
+
+    # Slot names of the fields above, in the same order.
+    FIELDS = (
+        "accountId",
+        "asmEnabled",
+        "automaticModeEnabled",
+        "boundryOffset",
+        "childLock",
+        "circumference",
+        "cModuleId",
+        "codePage",
+        "coordinateLatitude",
+        "coordinateLongitude",
+        "corridorMode",
+        "demoModeEnabled",
+        "deviceType",
+        "deviceTypeDescription",
+        "edgeMowingMode",
+        "endOfContract",
+        "energyMode",
+        "externalId",
+        "firmwareVersion",
+        "gdprAccepted",
+        "gpsProtectionEnabled",
+        "id",
+        "imsi",
+        "lastWeatherCheck",
+        "ledStatus",
+        "localTimezoneOffset",
+        "mappingIntelligentHomeDrive",
+        "mowerImageThumbnailUrl",
+        "mowerImageUrl",
+        "name",
+        "protectionLevel",
+        "rainSensorMode",
+        "smartLogic",
+        "softwarePacket",
+        "status",
+        "team",
+        "teamable",
+        "timeZone",
+        "unitFormat",
+        "version",
+    )
+
     ERROR_MAINSTATE_CODE = 1
 
+    __slots__ = (
+        *FIELDS,
+        "imow",
+        "_derived",
+        "_extra",
+        "_subscribers",
+        "__weakref__",
+    )
+
     def __init__(self, upstream: dict, imow: "IMowApi") -> None:
-        self.imow = imow
-
-        self.stateMessage: Dict[str, Any] = {
-            "short": "",
-            "long": "",
-            "legacyMessage": "",
-            "errorId": "",
-            "error": False,
-        }
-        self.machineError: Optional[str] = None
-        self.machineState: Optional[str] = None
-        self.replace_state(upstream)
-
-    def replace_state(self, upstream: dict) -> None:
+        # Slots are set directly; __setattr__ only routes unknown names.
+        _set = object.__setattr__
+        _set(self, "_extra", None)
+        _set(self, "imow", imow)
+        _set(self, "_derived", None)
+        _set(self, "_subscribers", None)
+        self._assign(upstream)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when regular lookup failed: an unset slot or a key that
+        # is not a declared field.
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:  # not initialised yet (copy/pickle)
+            extra = None
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SLOT_NAMES:
+            object.__setattr__(self, name, value)
+            return
+        if name in _RESERVED_ATTRIBUTES:
+            raise AttributeError(f"{name!r} is derived from 'status' and read-only")
+        if self._extra is None:
+            self._extra = {}
+        self._extra[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        if name in _SLOT_NAMES:
+            object.__delattr__(self, name)
+        elif self._extra is not None and name in self._extra:
+            del self._extra[name]
+        else:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the upstream fields (and overflow attributes) as a new dict."""
+        fields = {}
+        for name in self.FIELDS:
+            try:
+                fields[name] = _FIELD_ACCESSORS[name][0](self)
+            except AttributeError:
+                continue
+        if self._extra:
+            fields.update(self._extra)
+        return fields
+
+    def replace_state(self, upstream: dict) -> FrozenSet[str]:
         """Merge an upstream payload into this instance.
 
         Reserved keys (see ``_RESERVED_ATTRIBUTES``) are dropped so a hostile or
         renamed upstream field cannot clobber the client back-reference or the
         derived message fields.
+
+        Returns:
+            The names of the fields whose value changed, plus
+            ``"status.<key>"`` for every changed key of the ``status`` block;
+            empty if the payload matches the current state. Subscribers (see
+            :meth:`subscribe`) are called with this set when it is not empty.
+        """
+        changed = self._merge(upstream)
+        if changed and self._subscribers:
+            self._notify(changed)
+        return changed
+
+    def _assign(self, upstream: dict) -> None:
+        """Copy a payload into a new instance (nothing to diff against)."""
+        extra = self._extra
+        for key, value in upstream.items():
+            # Declared fields never contain spaces, so try the raw key first.
+            accessors = _FIELD_ACCESSORS.get(key)
+            if accessors is not None:
+                accessors[1](self, value)
+                continue
+            key = key.replace(" ", "_")
+            if key not in _RESERVED_ATTRIBUTES:
+                if extra is None:
+                    extra = self._extra = {}
+                extra[sys.intern(key)] = value
+
+    def _merge(self, upstream: dict) -> FrozenSet[str]:
+        """Copy changed values from a payload and return their names."""
+        changed: List[str] = []
+        extra = self._extra
+        for key, value in upstream.items():
+            accessors = _FIELD_ACCESSORS.get(key)
+            if accessors is not None:
+                getter, setter = accessors
+                try:
+                    old = getter(self)
+                except AttributeError:
+                    old = _MISSING
+                # Identity first: unchanged values are often the same object.
+                if old is value or old == value:
+                    continue
+                setter(self, value)
+            else:
+                key = key.replace(" ", "_")
+                if key in _RESERVED_ATTRIBUTES:
+                    continue
+                if extra is None:
+                    extra = self._extra = {}
+                old = extra.get(key, _MISSING)
+                if old is value or old == value:
+                    continue
+                extra[sys.intern(key)] = value
+            changed.append(key)
+            if key == "status":
+                changed.extend(_status_changes(old, value))
+        return frozenset(changed)
+
+    def subscribe(
+        self, field: Optional[str], callback: ChangeCallback
+    ) -> Callable[[], None]:
+        """Call ``callback(mower, changed)`` when ``field`` changes.
+
+        ``field`` is a field name such as ``"coordinateLatitude"``,
+        ``"status.<key>"`` for a key of the ``status`` block (e.g.
+        ``"status.mainState"``), or ``None`` for any change. ``changed`` is the
+        set returned by :meth:`replace_state`. Exceptions raised by a callback
+        are logged and do not stop the other callbacks.
+
+        Returns:
+            A function that removes the subscription again.
+        """
+        subscription = (field, callback)
+        if self._subscribers is None:
+            self._subscribers = []
+        self._subscribers.append(subscription)
+
+        def unsubscribe() -> None:
+            if self._subscribers and subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+        return unsubscribe
+
+    def _notify(self, changed: FrozenSet[str]) -> None:
+        for field, callback in list(self._subscribers or ()):
+            if field is not None and field not in changed:
+                continue
+            try:
+                callback(self, changed)
+            except Exception:
+                logger.exception("Change callback %r for %r failed", callback, field)
+
+    def watch(
+        self, interval: float = 30.0, changes: bool = False
+    ) -> AsyncIterator[Any]:
+        """Yield this mower's state whenever it changed (see ``IMowApi.watch``).
+
+        Unless the mower is already being watched, the shared poll starts from
+        this instance and updates it in place.
         """
-        cleaned = {
-            key.replace(" ", "_"): value
-            for key, value in upstream.items()
-            if key.replace(" ", "_") not in _RESERVED_ATTRIBUTES
-        }
-        self.__dict__.update(cleaned)
-        self.update_state_messages()
+        return self.imow.watch(self.id, interval=interval, changes=changes, state=self)
 
     async def update_setting(self, setting: str, new_value: Any) -> None:
         await self.imow.update_setting(
@@ -127,68 +353,90 @@ def _get_state_codes(self) -> Optional[tuple[int, bool]]:
         short_code = status["extraStatus"] if is_error else status["mainState"]
         return short_code, is_error
 
-    def update_state_messages(self) -> None:
+    @property
+    def stateMessage(self) -> Mapping[str, Any]:
+        return self._derive()[3]
+
+    @property
+    def machineError(self) -> Optional[str]:
+        return self._derive()[4]
+
+    @property
+    def machineState(self) -> str:
+        return self._derive()[5]
+
+    def _derive(self) -> tuple:
+        """Return ``(codes, messages_user, messages_en, stateMessage,
+        machineError, machineState)``, resolving the last three only if the
+        status codes or the client's message tables changed since last time.
+
+        When a code cannot be resolved, the previous ``stateMessage`` and
+        ``machineError`` are kept and ``machineState`` becomes ``UNKNOWN``.
+        """
         codes = self._get_state_codes()
-        if codes is None or self.imow.messages_user is None:
-            if codes is None:
-                logger.debug("MowerState has no usable 'status'; state UNKNOWN")
-            else:
+        messages_user = self.imow.messages_user
+        messages_en = self.imow.messages_en
+        derived = self._derived
+        if (
+            derived is not None
+            and derived[0] == codes
+            and derived[1] is messages_user
+            and derived[2] is messages_en
+        ):
+            return derived
+
+        if derived is None:
+            state_message, machine_error = _EMPTY_STATE_MESSAGE, None
+        else:
+            state_message, machine_error = derived[3], derived[4]
+        machine_state = _UNKNOWN_MACHINE_STATE
+        if codes is None:
+            logger.debug("MowerState has no usable 'status'; state UNKNOWN")
+        else:
+            short_code, is_error = codes
+            if messages_user is None:
                 logger.debug("i18n messages not loaded yet; skipping state messages")
-            # Still derive a (neutral) machineState so it is never left as None.
-            self.generate_machine_state()
-            return
-        short_code, is_error = codes
-        messages = self.imow.messages_user
-
-        try:
-            if not is_error:
-                (
-                    self.stateMessage["short"],
-                    self.stateMessage["long"],
-                ) = messages.get_status_message(short_code=short_code)
-                self.stateMessage["error"] = False
-                self.machineError = None
-                self.stateMessage["errorId"] = ""
             else:
-                (
-                    self.stateMessage["short"],
-                    self.stateMessage["long"],
-                    self.stateMessage["errorId"],
-                    self.stateMessage["legacyMessage"],
-                ) = messages.get_error_message(short_code=short_code)
-                self.stateMessage["error"] = True
-                self.machineError = self.stateMessage["errorId"]
-        except MessageNotFoundError as err:
-            logger.warning("Unknown mower state/error code: %s", err)
-        self.generate_machine_state()
+                try:
+                    state_message = messages_user.state_message(short_code, is_error)
+                except MessageNotFoundError as err:
+                    logger.warning("Unknown mower state/error code: %s", err)
+                else:
+                    machine_error = state_message["errorId"] if is_error else None
+            if messages_en is not None:
+                try:
+                    short = messages_en.state_message(short_code, is_error)["short"]
+                except MessageNotFoundError:
+                    pass
+                else:
+                    machine_state = short.upper().replace(" ", "_").replace(".", "")
+
+        derived = (
+            codes,
+            messages_user,
+            messages_en,
+            state_message,
+            machine_error,
+            machine_state,
+        )
+        object.__setattr__(self, "_derived", derived)
+        return derived
 
-    def generate_machine_state(self) -> None:
-        codes = self._get_state_codes()
-        if codes is None or self.imow.messages_en is None:
-            self.machineState = _UNKNOWN_MACHINE_STATE
-            return
-        short_code, is_error = codes
-        messages = self.imow.messages_en
+    def update_state_messages(self) -> None:
+        """Resolve ``stateMessage``/``machineError``/``machineState`` now.
 
-        try:
-            if not is_error:
-                state_msg_short, _ = messages.get_status_message(short_code=short_code)
-            else:
-                (
-                    state_msg_short,
-                    _long,
-                    _error_id,
-                    _legacy,
-                ) = messages.get_error_message(short_code=short_code)
-        except MessageNotFoundError:
-            self.machineState = _UNKNOWN_MACHINE_STATE
-            return
+        Not needed in normal use: they are resolved on first access and
+        whenever ``status`` or the loaded message tables change.
+        """
+        self._derive()
 
-        self.machineState = state_msg_short.upper().replace(" ", "_").replace(".", "")
+    def generate_machine_state(self) -> None:
+        """Alias of :meth:`update_state_messages`."""
+        self._derive()
 
     async def update_from_upstream(self) -> "MowerState":
         response = await self.imow.receive_mower_by_id(self.id)
-        self.replace_state(response.__dict__)
+        self.replace_state(response.as_dict())
         return self
 
     def get_current_task(self) -> str:
@@ -226,3 +474,22 @@ async def intent(
             test_mode=test_mode,
             **kwargs,
         )
+
+
+_SLOT_NAMES = frozenset(MowerState.__slots__)
+# Slot descriptors of the payload fields, bound once for replace_state/as_dict.
+_FIELD_ACCESSORS: Dict[str, Tuple[Callable[..., Any], Callable[..., None]]] = {
+    name: (getattr(MowerState, name).__get__, getattr(MowerState, name).__set__)
+    for name in MowerState.FIELDS
+}
+
+
+def _status_changes(old: Any, new: Any) -> List[str]:
+    """``"status.<key>"`` for every key that differs between two status dicts."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return []
+    return [
+        f"status.{key}"
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    ]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from imow.common.lrucache import LRUCache
+
+# Per-endpoint time-to-live in seconds. Mower state changes while mowing, so it
+# is kept short; statistics, start points and the account change rarely.
+DEFAULT_TTLS: Dict[str, float] = {
+    "mower": 30,
+    "statistics": 300,
+    "start_points": 3600,
+    "account": 3600,
+}
+
+# Endpoints whose entries belong to a single mower (keyed by the mower id) and
+# are dropped by ``invalidate_mower``.
+_MOWER_ENDPOINTS = frozenset({"mower", "statistics", "start_points"})
+
+
+class ResponseCache(LRUCache[Tuple[str, Hashable], Tuple[float, Any]]):
+    """A small read-through cache for parsed upstream responses.
+
+    Entries are keyed by ``(endpoint, key)`` where ``endpoint`` is one of the
+    names in :data:`DEFAULT_TTLS` and ``key`` is usually the mower id. Each
+    endpoint has its own TTL; an endpoint with a TTL of ``0`` is never cached.
+    Expired entries count as misses and are dropped when they are read.
+
+    Args:
+        ttls: Per-endpoint TTL overrides, merged over :data:`DEFAULT_TTLS`.
+        max_entries: Upper bound on the number of cached responses.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_entries)
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._clock = clock
+        # Mower externalId -> id, learned from cached mower payloads so that
+        # actions addressed by externalId can invalidate the right entries.
+        self._external_ids: Dict[str, str] = {}
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or ``None`` on a miss or expired entry."""
+        entry_key = (endpoint, key)
+        entry = self._recall(entry_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[entry_key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """Store ``value`` for its endpoint TTL (``None`` values are not cached)."""
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0 or value is None:
+            return
+        self._remember((endpoint, key), (self._clock() + ttl, value))
+        if endpoint == "mower" and isinstance(value, dict):
+            external_id = value.get("externalId")
+            if external_id:
+                self._external_ids[str(external_id)] = str(key)
+
+    def invalidate_mower(
+        self,
+        mower_id: Optional[Hashable] = None,
+        external_id: Optional[str] = None,
+    ) -> None:
+        """Drop all cached entries belonging to one mower.
+
+        The mower can be given by id or by externalId. If only an unknown
+        externalId is given, every mower entry is dropped to stay correct.
+        """
+        if mower_id is None and external_id:
+            mower_id = self._external_ids.get(external_id)
+        for endpoint, key in list(self._entries):
+            if endpoint not in _MOWER_ENDPOINTS:
+                continue
+            if mower_id is None or str(key) == str(mower_id):
+                del self._entries[(endpoint, key)]
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        super().clear()
+        self._external_ids.clear()
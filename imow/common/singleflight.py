@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one shared flight.
+
+    The first caller for a key starts ``factory()`` as a task; callers that
+    arrive with the same key while it is running await that same task and get
+    the same result (or the same exception). The key is forgotten as soon as
+    the flight finishes, so later calls start a new one.
+
+    The flight runs as its own task and every caller awaits it through
+    :func:`asyncio.shield`, so one cancelled caller does not cancel the request
+    for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def in_flight(self, key: Hashable) -> Optional["asyncio.Task[Any]"]:
+        """Return the running flight for ``key``, if any."""
+        return self._flights.get(key)
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory`` once per concurrent ``key`` and return its result."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(factory())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _task: self._forget(key, _task))
+        return await asyncio.shield(flight)
+
+    def _forget(self, key: Hashable, flight: "asyncio.Task[Any]") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the outcome as retrieved even if every caller was cancelled, so
+        # asyncio doesn't log "exception was never retrieved".
+        if not flight.cancelled():
+            flight.exception()
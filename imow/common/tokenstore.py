@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from imow.common.atomicfile import write_json_atomic
+
+logger = logging.getLogger("imow")
+
+# A stored token and its expiry (``None`` if unknown).
+StoredToken = Tuple[str, Optional[datetime]]
+
+
+def account_key(email: str) -> str:
+    """Return the store key for an account.
+
+    The e-mail address is hashed so token files don't reveal which accounts
+    they hold.
+    """
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+
+class TokenStore(ABC):
+    """Interface for persisting access tokens across process restarts.
+
+    Subclass and implement :meth:`load`, :meth:`save` and :meth:`delete` to back
+    tokens by e.g. a keyring or a database; a subclass missing one of them
+    cannot be instantiated. ``account`` is the key returned by
+    :func:`account_key`.
+    """
+
+    @abstractmethod
+    async def load(self, account: str) -> Optional[StoredToken]:
+        """Return the stored token of ``account``, or ``None``."""
+
+    @abstractmethod
+    async def save(
+        self, account: str, access_token: str, token_expires: Optional[datetime]
+    ) -> None:
+        """Store the token of ``account``, replacing any previous one."""
+
+    @abstractmethod
+    async def delete(self, account: str) -> None:
+        """Forget the token of ``account`` (no error if there is none)."""
+
+
+class FileTokenStore(TokenStore):
+    """Store tokens for any number of accounts in one JSON file.
+
+    Writes go to a temporary file in the same directory that is then renamed
+    over the target, so readers never see a partial file. The file is created
+    with ``0600`` permissions because it holds bearer tokens.
+
+    Args:
+        path: Location of the JSON file (created on first save).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = asyncio.Lock()
+
+    async def load(self, account: str) -> Optional[StoredToken]:
+        entry = (await asyncio.to_thread(self._read)).get(account)
+        if not entry or not entry.get("access_token"):
+            return None
+        expires = entry.get("token_expires")
+        return (
+            entry["access_token"],
+            datetime.fromisoformat(expires) if expires else None,
+        )
+
+    async def save(
+        self, account: str, access_token: str, token_expires: Optional[datetime]
+    ) -> None:
+        async with self._lock:
+            tokens = await asyncio.to_thread(self._read)
+            tokens[account] = {
+                "access_token": access_token,
+                "token_expires": token_expires.isoformat() if token_expires else None,
+            }
+            await asyncio.to_thread(self._write, tokens)
+
+    async def delete(self, account: str) -> None:
+        async with self._lock:
+            tokens = await asyncio.to_thread(self._read)
+            if tokens.pop(account, None) is not None:
+                await asyncio.to_thread(self._write, tokens)
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            logger.warning("Ignoring unreadable token store %s: %s", self.path, err)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, tokens: Dict[str, dict]) -> None:
+        write_json_atomic(self.path, tokens)
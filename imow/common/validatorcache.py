@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from imow.common.lrucache import LRUCache
+
+# (ETag, Last-Modified, parsed body) of the last validated response.
+_Entry = Tuple[Optional[str], Optional[str], Any]
+
+
+class ValidatorCache(LRUCache[str, _Entry]):
+    """Remember HTTP validators and the parsed body per GET URL.
+
+    When a response carries an ``ETag`` and/or ``Last-Modified`` header, both
+    are stored with the parsed body. The next GET of that URL then sends
+    ``If-None-Match``/``If-Modified-Since`` (see :meth:`request_headers`), and a
+    ``304 Not Modified`` answer is served from the stored body (see
+    :meth:`not_modified`). Responses without validators are not stored.
+
+    ``revalidations`` counts the conditional requests sent, ``hits`` the 304
+    answers served from a stored body and ``misses`` those whose body had been
+    evicted in the meantime.
+
+    Args:
+        max_entries: Upper bound on the number of URLs remembered.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        super().__init__(max_entries)
+        self.revalidations = 0
+
+    def request_headers(self, url: Any) -> Dict[str, str]:
+        """Return the conditional headers to send for ``url`` (maybe empty)."""
+        entry = self._entries.get(str(url))
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        self.revalidations += 1
+        return headers
+
+    def store(self, url: Any, headers: Mapping[str, str], body: Any) -> None:
+        """Remember ``body`` with the validators found in response ``headers``."""
+        key = str(url)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+        self._remember(key, (etag, last_modified, body))
+
+    def not_modified(self, url: Any) -> Tuple[bool, Any]:
+        """Return ``(True, body)`` for a 304 on ``url``, ``(False, None)`` if
+        the body is no longer stored."""
+        entry = self._recall(str(url))
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, entry[2]
+
+    def _counters(self) -> Dict[str, int]:
+        return {**super()._counters(), "revalidations": self.revalidations}
@@ -5,35 +5,64 @@
 ``aioresponses``; pure functions are tested directly.
 """
 
+import asyncio
+import contextlib
+import json
+import os
+import stat
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from http.cookies import SimpleCookie
+
 import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
+from yarl import URL
 
 from imow.api import (
     IMowApi,
     _build_start_from_point_value,
     _build_start_mowing_value,
-    _extract_attr,
+    _request_slots,
     _utcnow,
     validate_and_fix_datetime,
 )
+from imow.api.poller import FleetPoller, classify
+from imow.api.pool import IMowClientPool
+from imow.api.watch import WatchSlot
 from imow.common.actions import IMowActions
+from imow.common.circuitbreaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
 from imow.common.consts import (
     IMOW_API_URI,
+    IMOW_APP_URI,
+    IMOW_COOKIE_HOSTS,
     IMOW_I18N_BASE_URI,
     IMOW_MAINTENANCE_URI,
     IMOW_OAUTH_URI,
     IMOW_USER_API_URI,
 )
+from imow.common.digestcache import PayloadDigestCache
 from imow.common.exceptions import (
     ApiMaintenanceError,
+    ClientClosingError,
     IMowError,
     LanguageNotFoundError,
     LoginError,
     MessageNotFoundError,
 )
+from imow.common.i18n import MessagesRegistry
+from imow.common.loginform import extract_login_form
 from imow.common.messages import Messages
+from imow.common.mowerindex import MowerIndex
 from imow.common.mowerstate import MowerState
+from imow.common.pacing import RequestPacer
+from imow.common.responsecache import ResponseCache
+from imow.common.tokenstore import FileTokenStore, TokenStore, account_key
+from imow.common.validatorcache import ValidatorCache
 
 FAKE_TOKEN = "x" * 98
 
@@ -123,16 +152,6 @@ def test_build_start_mowing_only_starttime_defaults_two_hours(self):
             == "0000000123456789,2023-08-12 22:00,2023-08-12 20:00"
         )
 
-    def test_extract_attr_none_element(self):
-        assert _extract_attr(None, "value") is None
-
-    def test_extract_attr_multivalue(self):
-        class FakeTag:
-            def get(self, attr):
-                return ["a", "b"]
-
-        assert _extract_attr(FakeTag(), "class") == "a b"
-
 
 # --------------------------------------------------------------------------- #
 # Exceptions
@@ -179,6 +198,29 @@ def test_missing_i18n_key_raises_typed(self):
         with pytest.raises(MessageNotFoundError):
             Messages({}).get_status_message(short_code=7)
 
+    def test_missing_error_i18n_key_raises_typed(self):
+        with pytest.raises(MessageNotFoundError, match="message_M1010_long"):
+            Messages({"message_M1010_short": "Lifted"}).get_error_message(73)
+
+    def test_texts_are_resolved_once_and_catalogue_is_shared(self):
+        i18n = dict(I18N_EN)
+        messages = Messages(i18n)
+        i18n["viking_mainstate_charge_short"] = "changed later"
+        assert messages.get_status_message(short_code=7)[0] == "Charging"
+        assert messages.error_messages is Messages({}).error_messages
+
+    def test_only_resolved_texts_are_kept_and_interned(self):
+        i18n = dict(I18N_EN, app_title="iMow", **{"footer_text": "x" * 100})
+        messages = Messages(i18n)
+        assert "i18n" not in vars(messages)
+        assert "app_title" not in messages.i18n
+        assert messages.i18n["viking_mainstate_charge_short"] == "Charging"
+        # Texts are interned, so clients loading the same file share them.
+        other = Messages(json.loads(json.dumps(i18n)))
+        assert other.get_error_message(73)[1] is messages.get_error_message(73)[1]
+        with pytest.raises(TypeError):
+            messages.i18n["app_title"] = "changed"
+
 
 # --------------------------------------------------------------------------- #
 # MowerState
@@ -224,6 +266,110 @@ def test_error_state_sets_machine_error(self):
         assert mower.stateMessage["error"] is True
         assert mower.machineError == "M1010"
 
+    def test_fields_are_slots_with_overflow_for_unknown_keys(self):
+        api = _make_api()
+        mower = MowerState(dict(MOWER_PAYLOAD, newFirmwareField=3), api)
+        assert not hasattr(mower, "__dict__")
+        internal = set(MowerState.__slots__) - set(MowerState.FIELDS)
+        assert set(MowerState.FIELDS) == {
+            name
+            for name in MowerState.__annotations__
+            if name not in ("stateMessage", "machineError", "machineState")
+            and name not in internal
+        }
+        assert mower.newFirmwareField == 3
+        mower.statistics = {"totalOperatingTime": 10}
+        assert mower.statistics["totalOperatingTime"] == 10
+        with pytest.raises(AttributeError):
+            mower.firmwareVersion  # declared but not in the payload
+        assert mower.as_dict() == dict(
+            MOWER_PAYLOAD, newFirmwareField=3, statistics={"totalOperatingTime": 10}
+        )
+
+    def test_state_message_is_shared_and_read_only(self):
+        api = _make_api()
+        first = MowerState(MOWER_PAYLOAD, api)
+        second = MowerState(dict(MOWER_PAYLOAD, id="2"), api)
+        assert first.stateMessage is second.stateMessage
+        with pytest.raises(TypeError):
+            first.stateMessage["short"] = "changed"
+
+    def test_derived_fields_are_lazy_and_memoized_per_status(self):
+        api = _make_api()
+        calls = []
+        resolve = api.messages_en.state_message
+
+        def counting_resolve(*args):
+            calls.append(args)
+            return resolve(*args)
+
+        api.messages_en.state_message = counting_resolve
+        mower = MowerState(MOWER_PAYLOAD, api)
+        assert calls == []
+        assert mower.machineState == "CHARGING"
+        assert mower.stateMessage["short"] == "Charging"
+        assert len(calls) == 2  # user + en table (the same object here)
+
+        mower.replace_state(dict(MOWER_PAYLOAD, coordinateLatitude=54.2))
+        assert mower.machineState == "CHARGING"
+        assert len(calls) == 2  # same codes: nothing resolved again
+
+        error = {"mainState": 1, "extraStatus": 73, "online": True}
+        mower.replace_state(dict(MOWER_PAYLOAD, status=error))
+        assert mower.machineError == "M1010"
+        assert len(calls) == 4
+        with pytest.raises(AttributeError):
+            mower.machineState = "MOWING"
+
+    def test_replace_state_returns_changed_fields(self):
+        api = _make_api()
+        mower = MowerState(MOWER_PAYLOAD, api)
+        assert mower.replace_state(dict(MOWER_PAYLOAD)) == frozenset()
+        moved = dict(
+            MOWER_PAYLOAD,
+            coordinateLatitude=54.2,
+            status=dict(MOWER_PAYLOAD["status"], mainState=5, rainStatus=True),
+            newField=1,
+        )
+        assert mower.replace_state(moved) == {
+            "coordinateLatitude",
+            "newField",
+            "status",
+            "status.mainState",
+            "status.rainStatus",
+        }
+        assert mower.coordinateLatitude == 54.2
+        assert mower.replace_state(moved) == frozenset()
+
+    def test_subscribers_are_called_for_their_field(self, caplog):
+        api = _make_api()
+        mower = MowerState(MOWER_PAYLOAD, api)
+        seen = []
+        mower.subscribe("status.mainState", lambda m, c: seen.append(("state", c)))
+        mower.subscribe(None, lambda m, c: seen.append(("any", c)))
+        unsubscribe = mower.subscribe("name", lambda m, c: seen.append(("name", c)))
+        mower.subscribe("name", lambda m, c: 1 / 0)
+        unsubscribe()
+
+        mower.replace_state(dict(MOWER_PAYLOAD, coordinateLatitude=1.0))
+        assert seen == [("any", {"coordinateLatitude"})]
+        mower.replace_state(dict(MOWER_PAYLOAD, coordinateLatitude=1.0))
+        assert len(seen) == 1  # unchanged: nobody is called
+
+        seen.clear()
+        status = dict(MOWER_PAYLOAD["status"], mainState=5)
+        mower.replace_state(dict(MOWER_PAYLOAD, status=status, name="New"))
+        assert [kind for kind, _ in seen] == ["state", "any"]
+        assert "Change callback" in caplog.text  # failing callback is logged
+
+    def test_language_switch_is_picked_up_without_refresh(self):
+        api = _make_api()
+        mower = MowerState(MOWER_PAYLOAD, api)
+        assert mower.stateMessage["short"] == "Charging"
+        api.messages_user = Messages(I18N_DE)
+        assert mower.stateMessage["short"] == "Laden"
+        assert mower.machineState == "CHARGING"
+
 
 # --------------------------------------------------------------------------- #
 # intent() action-value construction (POST body is asserted)
@@ -318,6 +464,33 @@ def _stub_messages(mocked):
     mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", payload=I18N_EN)
 
 
+class TestLoginFormExtractor:
+    def test_reads_inputs(self):
+        form = extract_login_form(LOGIN_FORM_HTML)
+        assert form.csrf_token == "the-csrf-token"
+        assert form.request_id == "the-request-id"
+
+    def test_prefers_input_over_meta(self):
+        html = (
+            '<meta name="csrf-token" content="meta-csrf">'
+            '<input name="csrf-token" value="input-csrf">'
+            '<input name="requestId" value="rid">'
+        )
+        assert extract_login_form(html).csrf_token == "input-csrf"
+
+    def test_stops_after_fields(self):
+        # Markup after the fields is never tokenized, so even a trailing SPA
+        # root element is not seen.
+        html = LOGIN_FORM_HTML + "x" * 10000 + SPA_SHELL_HTML
+        form = extract_login_form(html)
+        assert form.request_id == "the-request-id"
+        assert form.spa_shell is False
+
+    def test_detects_spa_shell(self):
+        form = extract_login_form(SPA_SHELL_HTML)
+        assert form.csrf_token is None and form.spa_shell
+
+
 class TestAuthFlow:
     @pytest.mark.asyncio
     async def test_successful_login_parses_token_from_fragment(self):
@@ -569,6 +742,1337 @@ async def test_500_on_maintenance_reports_outage(self):
         await api.close()
 
 
+# --------------------------------------------------------------------------- #
+# Response cache: TTL, LRU eviction, write invalidation
+# --------------------------------------------------------------------------- #
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    def test_ttl_expiry_and_counters(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"statistics": 10}, clock=clock)
+        cache.put("statistics", "1", {"a": 1})
+        assert cache.get("statistics", "1") == {"a": 1}
+        clock.now = 11
+        assert cache.get("statistics", "1") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 0}
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("mower", "1", {"id": "1"})
+        cache.put("mower", "2", {"id": "2"})
+        cache.get("mower", "1")  # 1 is now most recently used
+        cache.put("mower", "3", {"id": "3"})
+        assert cache.get("mower", "2") is None
+        assert cache.get("mower", "1") is not None
+
+    def test_invalidate_by_external_id(self):
+        cache = ResponseCache()
+        cache.put("mower", "31466", MOWER_PAYLOAD)
+        cache.put("statistics", "31466", {"x": 1})
+        cache.put("mower", "2", {"id": "2"})
+        cache.put("account", "me", {"id": "45480"})
+        cache.invalidate_mower(external_id="0000000123456789")
+        assert cache.get("mower", "31466") is None
+        assert cache.get("statistics", "31466") is None
+        assert cache.get("mower", "2") is not None
+        assert cache.get("account", "me") is not None
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_cache(self):
+        api = _make_api(response_cache=ResponseCache())
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD)
+            first = await api.receive_mower_by_id("31466")
+            second = await api.receive_mower_by_id("31466")
+            assert first.name == second.name == "Maehrlin"
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        assert api.response_cache.hits == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_intent_invalidates_mower_entries(self):
+        api = _make_api(response_cache=ResponseCache())
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD, repeat=True
+            )
+            mocked.post(f"{IMOW_API_URI}/mower-actions/", status=201, payload={})
+            await api.receive_mower_by_id("31466")
+            await api.intent(
+                IMowActions.TO_DOCKING, mower_external_id="0000000123456789"
+            )
+            await api.receive_mower_by_id("31466")
+            gets = [c for (m, _), c in mocked.requests.items() if m == "GET"]
+            assert sum(len(c) for c in gets) == 2
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_update_setting_refills_cache_for_int_ids(self):
+        api = _make_api(response_cache=ResponseCache(), pacer=RequestPacer(mower_gap=0))
+        url = f"{IMOW_API_URI}/mowers/31466/"
+        with aioresponses() as mocked:
+            # A full payload, with the id as an int like upstream sends it.
+            full = {**dict.fromkeys(MowerState.FIELDS), **MOWER_PAYLOAD, "id": 31466}
+            mocked.get(url, payload=full)
+            mocked.put(url, payload=dict(full, name="Renamed"))
+            await api.update_setting(31466, "name", "Renamed")
+            cached = await api.receive_mower_by_id("31466")
+            assert cached.name == "Renamed"
+            assert len(mocked.requests[("GET", URL(url))]) == 1
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Single-flight coalescing of concurrent GETs
+# --------------------------------------------------------------------------- #
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_request(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD])
+            results = await asyncio.gather(*(api.receive_mowers() for _ in range(10)))
+            assert all(r[0].name == "Maehrlin" for r in results)
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_waiter(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/", status=404)
+            results = await asyncio.gather(
+                *(api.receive_mower_by_id("31466") for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(r, aiohttp.ClientResponseError) for r in results)
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_sequential_reads_are_not_coalesced(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[], repeat=True)
+            await api.receive_mowers()
+            await api.receive_mowers()
+            assert sum(len(c) for c in mocked.requests.values()) == 2
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Per-mower reads served from the fleet list
+# --------------------------------------------------------------------------- #
+class TestFleetPiggyback:
+    @pytest.mark.asyncio
+    async def test_by_id_joins_in_flight_list_request(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD])
+            mowers, mower = await asyncio.gather(
+                api.receive_mowers(), api.receive_mower_by_id("31466")
+            )
+            assert mower.externalId == mowers[0].externalId
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_by_id_served_within_freshness_window(self):
+        api = _make_api(fleet_freshness=60)
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD])
+            await api.receive_mowers()
+            mower = await api.receive_mower_by_id(31466)
+            assert mower.name == "Maehrlin"
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_by_id_requests_itself_without_window(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD])
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD)
+            await api.receive_mowers()
+            await api.receive_mower_by_id("31466")
+            assert sum(len(c) for c in mocked.requests.values()) == 2
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_list_started_before_a_write_is_not_reused(self):
+        api = _make_api(fleet_freshness=60)
+        listed, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_list(url, **kwargs):
+            listed.set()
+            await release.wait()
+
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD], callback=slow_list
+            )
+            mocked.post(f"{IMOW_API_URI}/mower-actions/", status=201, payload={})
+            mocked.get(
+                f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD, repeat=True
+            )
+            listing = asyncio.ensure_future(api.receive_mowers())
+            await listed.wait()
+            await api.intent(
+                IMowActions.TO_DOCKING, mower_external_id="0000000123456789"
+            )
+            # Reads after the write neither join the older list request...
+            await asyncio.wait_for(api.receive_mower_by_id("31466"), 5)
+            release.set()
+            await listing
+            # ...nor get answered from the snapshot it would have left behind.
+            await api.receive_mower_by_id("31466")
+            by_id = mocked.requests[("GET", URL(f"{IMOW_API_URI}/mowers/31466/"))]
+            assert len(by_id) == 2
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Mower identity index
+# --------------------------------------------------------------------------- #
+class TestMowerIndex:
+    def test_lookup_by_every_field_and_expiry(self):
+        clock = FakeClock()
+        index = MowerIndex(ttl=10, clock=clock)
+        index.update([MOWER_PAYLOAD])
+        assert index.lookup("name", "Maehrlin").id == "31466"
+        assert index.lookup("id", 31466).externalId == "0000000123456789"
+        assert index.lookup("externalId", "0000000123456789").name == "Maehrlin"
+        clock.now = 10
+        assert index.lookup("name", "Maehrlin") is None
+
+    @pytest.mark.asyncio
+    async def test_intent_by_name_costs_one_request_once_indexed(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD])
+            mocked.post(f"{IMOW_API_URI}/mower-actions/", status=201, payload={})
+            await api.receive_mowers()
+            await api.intent(IMowActions.TO_DOCKING, mower_name="Maehrlin")
+            assert sum(len(c) for c in mocked.requests.values()) == 2
+            body = _json_body(_last_request(mocked, "POST"))
+            assert body["actionValue"] == "0000000123456789"
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_lookup_miss_refreshes_then_raises(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[MOWER_PAYLOAD], repeat=True)
+            assert await api.get_mower_id_from_name("Maehrlin") == "31466"
+            assert await api.get_mower_action_id_from_id("31466")
+            with pytest.raises(LookupError):
+                await api.get_mower_id_from_name("Unknown")
+            # One fill for the first lookup, one refresh for the miss.
+            assert sum(len(c) for c in mocked.requests.values()) == 2
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Request pacing
+# --------------------------------------------------------------------------- #
+class TestRequestPacer:
+    def test_bucket_allows_burst_then_paces(self):
+        clock = FakeClock()
+        pacer = RequestPacer(rate=2, burst=2, mower_gap=0, clock=clock)
+        assert pacer.reserve("api") == 0
+        assert pacer.reserve("api") == 0
+        assert pacer.reserve("api") == pytest.approx(0.5)
+        assert pacer.reserve("other-host") == 0
+
+    def test_mower_gap_only_applies_to_same_mower(self):
+        clock = FakeClock()
+        pacer = RequestPacer(rate=0, mower_gap=1, clock=clock)
+        assert pacer.reserve("api", "1") == 0
+        assert pacer.reserve("api", "2") == 0
+        assert pacer.reserve("api", "1") == pytest.approx(1)
+        clock.now = 5
+        assert pacer.reserve("api", "1") == 0
+
+    @pytest.mark.asyncio
+    async def test_state_with_statistics_is_spaced_per_mower(self):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        api = _make_api(pacer=RequestPacer(mower_gap=1, sleep=fake_sleep))
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD)
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/statistic/", payload={"s": 1})
+            mower = await api.receive_mower_state_with_statistics("31466")
+            assert mower.statistics == {"s": 1}
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 1
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Circuit breaker
+# --------------------------------------------------------------------------- #
+HEALTHY_STATUS = {"serverDisrupted": False, "serverDown": False, "affectedTill": None}
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_once_per_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.allow_request()
+        clock.now = 10
+        assert breaker.allow_request() and breaker.state == HALF_OPEN
+        assert not breaker.allow_request()  # only one trial
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == OPEN and breaker.retry_after() == 10
+
+    def test_failures_while_open_keep_the_recovery_time(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 8
+        breaker.record_failure()
+        breaker.trip()
+        assert breaker.state == OPEN and breaker.retry_after() == 2
+        clock.now = 10
+        assert breaker.allow_request() and breaker.state == HALF_OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_network(self):
+        api = _make_api(circuit_breaker=CircuitBreaker(failure_threshold=1))
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", status=503)
+            with pytest.raises(aiohttp.ClientResponseError):
+                await api.receive_mowers()
+            with pytest.raises(ApiMaintenanceError):
+                await api.receive_mowers()
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_maintenance_probe_result_is_reused(self):
+        api = _make_api()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", status=500, repeat=True)
+            mocked.get(IMOW_MAINTENANCE_URI, payload=HEALTHY_STATUS, repeat=True)
+            for _ in range(3):
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await api.receive_mowers()
+            probes = [
+                c for (_, url), c in mocked.requests.items() if "maint" in str(url)
+            ]
+            assert sum(len(c) for c in probes) == 1
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Persistent token store
+# --------------------------------------------------------------------------- #
+class TestTokenStore:
+    @pytest.mark.asyncio
+    async def test_file_store_round_trip_with_private_permissions(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        store = FileTokenStore(str(path))
+        expires = _utcnow() + timedelta(days=30)
+        await store.save("acct", FAKE_TOKEN, expires)
+        assert await store.load("acct") == (FAKE_TOKEN, expires)
+        assert await store.load("other") is None
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        await store.delete("acct")
+        assert await store.load("acct") is None
+
+    def test_incomplete_store_fails_on_creation(self):
+        class LoadOnly(TokenStore):
+            async def load(self, account):
+                return None
+
+        with pytest.raises(TypeError, match="delete"):
+            LoadOnly()
+
+    def test_account_key_is_normalised_and_opaque(self):
+        assert account_key(" A@B.c ") == account_key("a@b.c")
+        assert "a@b.c" not in account_key("a@b.c")
+
+    @pytest.mark.asyncio
+    async def test_restored_token_skips_login(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        expires = _utcnow() + timedelta(days=20)
+        await store.save(account_key("a@b.c"), FAKE_TOKEN, expires)
+        api = IMowApi(email="a@b.c", password="pw", token_store=store)
+        with aioresponses() as mocked:
+            token, restored_expiry = await api.get_token(return_expire_time=True)
+            assert not mocked.requests  # no login round-trips
+        assert token == FAKE_TOKEN
+        assert restored_expiry == expires
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Background token refresh
+# --------------------------------------------------------------------------- #
+class TestBackgroundTokenRefresh:
+    @pytest.mark.asyncio
+    async def test_requests_keep_old_token_while_refreshing(self):
+        api = _make_api(email="a@b.c", password="pw", background_token_refresh=True)
+        # Inside the refresh leeway but not expired yet.
+        api.token_expires = _utcnow() + timedelta(hours=1)
+        login_started = asyncio.Event()
+        release_login = asyncio.Event()
+
+        async def fake_authenticate(email, password):
+            login_started.set()
+            await release_login.wait()
+            api.access_token = "n" * 98
+            api.token_expires = _utcnow() + timedelta(days=30)
+
+        api._IMowApi__authenticate = fake_authenticate
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[], repeat=True)
+            await api.receive_mowers()  # starts the refresher
+            await asyncio.wait_for(login_started.wait(), 1)
+            # Not blocked by the running login, and still on the old token.
+            await asyncio.wait_for(api.receive_mowers(), 1)
+            headers = _last_request(mocked, "GET").kwargs["headers"]
+            assert headers["Authorization"] == f"Bearer {FAKE_TOKEN}"
+            release_login.set()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert api.access_token == "n" * 98
+        await api.close()
+        assert api._token_refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_refresher_idles_for_fresh_token(self):
+        api = _make_api(email="a@b.c", password="pw")
+        api.token_expires = _utcnow() + timedelta(days=30)
+        api.start_token_refresher()
+        await asyncio.sleep(0)
+        assert not api._token_refresh_task.done()
+        assert api.access_token == FAKE_TOKEN
+        await api.stop_token_refresher()
+
+
+# --------------------------------------------------------------------------- #
+# Import cost: login/i18n-only modules load on first use
+# --------------------------------------------------------------------------- #
+class TestLazyImports:
+    def test_import_api_does_not_load_login_or_i18n_modules(self):
+        lazy = ("furl", "imow.common.messages", "imow.common.loginform")
+        code = (
+            "import sys, imow.api; "
+            f"print(','.join(m for m in {lazy!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+
+# --------------------------------------------------------------------------- #
+# Process-wide i18n registry
+# --------------------------------------------------------------------------- #
+I18N_DE = {"viking_mainstate_charge_short": "Laden"}
+
+
+class TestMessagesRegistry:
+    @pytest.mark.asyncio
+    async def test_clients_share_one_download_per_language(self):
+        registry = MessagesRegistry()
+        apis = [IMowApi(token=FAKE_TOKEN, i18n_registry=registry) for _ in range(3)]
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", payload=I18N_EN)
+            await asyncio.gather(*(api.fetch_messages() for api in apis))
+            assert sum(len(c) for c in mocked.requests.values()) == 1
+        assert apis[0].messages_en is apis[2].messages_en
+        for api in apis:
+            await api.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_raw_returns_full_file_without_keeping_it(self):
+        registry = MessagesRegistry()
+        api = IMowApi(token=FAKE_TOKEN, i18n_registry=registry)
+        full = dict(I18N_EN, app_title="iMow")
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", payload=full, repeat=True)
+            assert await api.receive_i18n() == full
+            assert "en" not in registry
+            await api.fetch_messages()
+        assert "app_title" not in api.messages_en.i18n
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_user_language_and_switching_reuse_cache(self):
+        registry = MessagesRegistry()
+        api = IMowApi(token=FAKE_TOKEN, lang="de", i18n_registry=registry)
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", payload=I18N_EN)
+            mocked.get(f"{IMOW_I18N_BASE_URI}/de.json", payload=I18N_DE)
+            await api.fetch_messages()
+            assert api.messages_user.get_status_message(7)[0] == "Laden"
+            await api.set_language("en")
+            assert api.messages_user is api.messages_en
+            await api.set_language("de")
+            assert sum(len(c) for c in mocked.requests.values()) == 2
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_language_is_not_cached(self):
+        registry = MessagesRegistry()
+        api = IMowApi(token=FAKE_TOKEN, lang="xx", i18n_registry=registry)
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", payload=I18N_EN)
+            mocked.get(f"{IMOW_I18N_BASE_URI}/xx.json", status=404)
+            with pytest.raises(LanguageNotFoundError):
+                await api.fetch_messages()
+        assert "en" in registry and "xx" not in registry
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_loads_without_network_then_revalidates(self, tmp_path):
+        url = f"{IMOW_I18N_BASE_URI}/en.json"
+        async with aiohttp.ClientSession() as session:
+            with aioresponses() as mocked:
+                mocked.get(url, payload=I18N_EN, headers={"ETag": '"v1"'})
+                await MessagesRegistry(cache_dir=str(tmp_path)).get(session, "en")
+
+            # A new process: served from disk, revalidated in the background.
+            registry = MessagesRegistry(cache_dir=str(tmp_path))
+            with aioresponses() as mocked:
+                mocked.get(url, status=304)
+                messages = await registry.get(session, "en")
+                assert messages.get_status_message(7)[0] == "Charging"
+                await asyncio.gather(*registry._revalidations)
+                request = _last_request(mocked, "GET")
+                assert request.kwargs["headers"]["If-None-Match"] == '"v1"'
+            assert await registry.get(session, "en") is messages
+
+    @pytest.mark.asyncio
+    async def test_changed_file_replaces_cached_tables(self, tmp_path):
+        url = f"{IMOW_I18N_BASE_URI}/en.json"
+        changed = dict(I18N_EN, viking_mainstate_charge_short="Refuelling")
+        async with aiohttp.ClientSession() as session:
+            with aioresponses() as mocked:
+                mocked.get(url, payload=I18N_EN, headers={"ETag": '"v1"'})
+                await MessagesRegistry(cache_dir=str(tmp_path)).get(session, "en")
+            registry = MessagesRegistry(cache_dir=str(tmp_path))
+            with aioresponses() as mocked:
+                mocked.get(url, payload=changed, headers={"ETag": '"v2"'})
+                await registry.get(session, "en")
+                await asyncio.gather(*registry._revalidations)
+            messages = await registry.get(session, "en")
+            assert messages.get_status_message(7)[0] == "Refuelling"
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_revalidation_on_its_session(self, tmp_path):
+        url = f"{IMOW_I18N_BASE_URI}/en.json"
+        changed = dict(I18N_EN, viking_mainstate_charge_short="Refuelling")
+        async with aiohttp.ClientSession() as session:
+            with aioresponses() as mocked:
+                mocked.get(url, payload=I18N_EN, headers={"ETag": '"v1"'})
+                await MessagesRegistry(cache_dir=str(tmp_path)).get(session, "en")
+        # A short-lived run: load from disk, then close straight away.
+        registry = MessagesRegistry(cache_dir=str(tmp_path))
+        api = IMowApi(i18n_registry=registry)
+        with aioresponses() as mocked:
+            mocked.get(url, payload=changed, headers={"ETag": '"v2"'})
+            await api.fetch_messages()
+            await api.close()
+        assert not registry._revalidations
+        with open(tmp_path / "i18n-en.json", encoding="utf-8") as handle:
+            assert json.load(handle)["etag"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_fetch_raw_revalidates_the_disk_copy(self, tmp_path):
+        url = f"{IMOW_I18N_BASE_URI}/en.json"
+        full = dict(I18N_EN, app_title="iMow")
+        registry = MessagesRegistry(cache_dir=str(tmp_path))
+        async with aiohttp.ClientSession() as session:
+            with aioresponses() as mocked:
+                mocked.get(url, payload=full, headers={"ETag": '"v1"'})
+                mocked.get(url, status=304)
+                mocked.get(url, payload=I18N_EN, headers={"ETag": '"v2"'})
+                assert await registry.fetch_raw(session, "en") == full
+                assert await registry.fetch_raw(session, "en") == full
+                assert await registry.fetch_raw(session, "en") == I18N_EN
+                sent = [c.kwargs["headers"] for c in mocked.requests[("GET", URL(url))]]
+            with aioresponses():  # unreachable: the disk copy is returned
+                assert await registry.fetch_raw(session, "en") == I18N_EN
+        assert [h.get("If-None-Match") for h in sent] == [None, '"v1"', '"v1"']
+        assert "en" not in registry
+
+
+# --------------------------------------------------------------------------- #
+# Content-hash fast path
+# --------------------------------------------------------------------------- #
+class TestPayloadDigestCache:
+    def test_identical_body_is_not_decoded_again(self):
+        digests = PayloadDigestCache()
+        first = digests.parse("url", b'{"a": [1, 2]}')
+        assert digests.parse("url", b'{"a": [1, 2]}') is first
+        changed = digests.parse("url", b'{"a": [1, 3]}')
+        assert changed == {"a": [1, 3]} and changed is not first
+        assert digests.parse("other", b'{"a": [1, 3]}') is not changed
+        assert digests.parse("empty", b" ") is None
+        assert digests.stats() == {"hits": 1, "misses": 4, "reused": 0, "entries": 3}
+
+    def test_derived_object_is_reused_for_the_same_parsed_object(self):
+        digests = PayloadDigestCache(max_entries=1)
+        parsed = {"id": 1}
+        built = digests.derive("k", parsed, lambda p: object())
+        assert digests.derive("k", parsed, lambda p: object()) is built
+        assert digests.derive("k", {"id": 1}, lambda p: object()) is not built
+        digests.derive("other", parsed, lambda p: object())
+        assert digests.derive("k", parsed, lambda p: object()) is not built
+        assert digests.reused == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_fleet_reuses_mower_states(self):
+        digests = PayloadDigestCache()
+        api = _make_api(payload_digests=digests)
+        url = f"{IMOW_API_URI}/mowers/"
+        with aioresponses() as mocked:
+            mocked.get(url, payload=[MOWER_PAYLOAD])
+            mocked.get(url, payload=[MOWER_PAYLOAD])
+            moved = dict(MOWER_PAYLOAD, coordinateLatitude=1.0)
+            mocked.get(url, payload=[moved])
+            first = await api.receive_mowers()
+            second = await api.receive_mowers()
+            third = await api.receive_mowers()
+        assert second[0] is first[0]
+        assert third[0] is not first[0] and third[0].coordinateLatitude == 1.0
+        assert digests.hits == 1 and digests.reused == 1
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Conditional requests (against a local stand-in server)
+# --------------------------------------------------------------------------- #
+def _stand_in_app(seen_headers, validators: bool) -> web.Application:
+    """Serve the mower endpoints; honours If-None-Match when ``validators``."""
+    etag = '"fleet-v1"'
+
+    async def respond(request, body):
+        seen_headers.append(dict(request.headers))
+        if not validators:
+            return web.json_response(body)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            body,
+            headers={"ETag": etag, "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"},
+        )
+
+    async def mowers(request):
+        return await respond(request, [MOWER_PAYLOAD])
+
+    async def statistics(request):
+        return await respond(request, {"totalWorkingHours": 1})
+
+    async def start_points(request):
+        return await respond(request, [{"n": 0}])
+
+    app = web.Application()
+    app.router.add_get("/mowers/", mowers)
+    app.router.add_get("/mowers/{id}/statistic/", statistics)
+    app.router.add_get("/mowers/{id}/start-points/", start_points)
+    return app
+
+
+class TestConditionalRequests:
+    def test_evicted_url_is_counted_as_a_miss(self):
+        cache = ValidatorCache(max_entries=1)
+        cache.store("a", {"ETag": '"1"'}, {"n": 1})
+        cache.store("b", {"Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"}, [])
+        assert cache.request_headers("a") == {}
+        assert cache.not_modified("a") == (False, None)
+        assert cache.not_modified("b") == (True, [])
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "revalidations": 0,
+            "entries": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_validators_are_sent_back_and_304_reuses_body(self, monkeypatch):
+        seen = []
+        async with TestServer(_stand_in_app(seen, validators=True)) as server:
+            monkeypatch.setattr(
+                "imow.api.IMOW_API_URI", str(server.make_url("")).rstrip("/")
+            )
+            api = _make_api(pacer=RequestPacer(mower_gap=0))
+            first = await api.receive_mowers()
+            statistics = await api.receive_mower_statistics("31466")
+            start_points = await api.receive_mower_start_points("31466")
+            second = await api.receive_mowers()
+            assert await api.receive_mower_statistics("31466") is statistics
+            assert await api.receive_mower_start_points("31466") is start_points
+            await api.close()
+        assert "If-None-Match" not in seen[0]
+        assert seen[3]["If-None-Match"] == '"fleet-v1"'
+        assert seen[3]["If-Modified-Since"] == "Sat, 17 Oct 2026 10:00:00 GMT"
+        assert second[0].as_dict() == first[0].as_dict()
+        assert api.validator_cache.stats() == {
+            "hits": 3,
+            "misses": 0,
+            "revalidations": 3,
+            "entries": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_validators_means_plain_requests(self, monkeypatch):
+        seen = []
+        async with TestServer(_stand_in_app(seen, validators=False)) as server:
+            monkeypatch.setattr(
+                "imow.api.IMOW_API_URI", str(server.make_url("")).rstrip("/")
+            )
+            api = _make_api()
+            await api.receive_mowers()
+            mowers = await api.receive_mowers()
+            await api.close()
+        assert mowers[0].name == "Maehrlin"
+        assert all("If-None-Match" not in h for h in seen)
+        assert all("If-Modified-Since" not in h for h in seen)
+        assert len(api.validator_cache) == 0
+
+
+# --------------------------------------------------------------------------- #
+# Fleet poller
+# --------------------------------------------------------------------------- #
+MOWING = {"mainState": 5, "extraStatus": 0}
+CHARGING = {"mainState": 7, "extraStatus": 0}
+
+
+class FakeFleetClient:
+    """Stands in for an IMowApi account; serves ``fleet`` and counts calls."""
+
+    def __init__(self, *fleet: dict, gauge=None) -> None:
+        self.fleet = list(fleet)
+        self.calls: list = []
+        # Requests in flight (shared between clients) and the maximum seen.
+        self.gauge = gauge if gauge is not None else {"now": 0, "max": 0}
+        self._api = _make_api()
+
+    async def _serve(self, call) -> None:
+        self.calls.append(call)
+        self.gauge["now"] += 1
+        self.gauge["max"] = max(self.gauge["max"], self.gauge["now"])
+        await asyncio.sleep(0.01)
+        self.gauge["now"] -= 1
+
+    async def receive_mowers(self):
+        await self._serve("list")
+        return [MowerState(payload, self._api) for payload in self.fleet]
+
+    async def receive_mower_by_id(self, mower_id):
+        await self._serve(mower_id)
+        payload = next(p for p in self.fleet if p["id"] == mower_id)
+        return MowerState(payload, self._api)
+
+
+def _mower(mower_id: str, status: dict) -> dict:
+    return dict(MOWER_PAYLOAD, id=mower_id, status=status)
+
+
+def _poller(*clients, **kwargs) -> FleetPoller:
+    kwargs.setdefault("clock", FakeClock())
+    return FleetPoller(clients, rng=lambda: 0.5, **kwargs)  # no jitter
+
+
+class TestFleetPoller:
+    def test_classify_by_machine_state_and_error(self):
+        api = _make_api()
+        i18n = dict(I18N_EN, viking_mainstate_idle_short="Idle")
+        api.messages_en = api.messages_user = Messages(i18n)
+        assert classify(MowerState(_mower("1", MOWING), api)) == "active"
+        assert classify(MowerState(_mower("1", CHARGING), api)) == "idle"
+        assert classify(MowerState(_mower("1", {"mainState": 0}), api)) == "idle"
+        error = {"mainState": 1, "extraStatus": 73}
+        assert classify(MowerState(_mower("1", error), api)) == "error"
+        assert classify(MowerState(_mower("1", {"mainState": 99}), api)) == "unknown"
+
+    @pytest.mark.asyncio
+    async def test_schedules_per_mower_and_backs_off_when_unchanged(self):
+        client = FakeFleetClient(_mower("1", MOWING), _mower("2", CHARGING))
+        changes = []
+        poller = _poller(client, on_change=lambda m, c: changes.append((m.id, c)))
+        clock = poller._clock
+        assert await poller.poll_once() == 1  # discovery: one list request
+        assert poller.next_due() == 30  # the mowing one
+
+        clock.now = 30
+        await poller.poll_once()
+        assert client.calls == ["list", "1"]  # only the due mower, by id
+        assert poller.next_due() == 30 + 45  # unchanged: 30 * 1.5
+
+        client.fleet[0] = _mower("1", CHARGING)
+        clock.now = 75
+        await poller.poll_once()
+        assert changes == [("1", frozenset({"status", "status.mainState"}))]
+        assert poller.states["1"].machineState == "CHARGING"
+        assert poller.next_due() == 600  # mower 2 (idle since discovery)
+
+        clock.now = 75 + 600  # both idle mowers due
+        await poller.poll_once()
+        assert client.calls[-1] == "list"  # two due mowers: one list request
+
+    def test_backoff_stops_growing_at_max_interval(self):
+        client = FakeFleetClient(_mower("1", CHARGING))
+        poller = _poller(client)
+        mower = MowerState(client.fleet[0], client._api)
+        assert poller.interval(mower, 5000) == poller.max_interval
+        for _ in range(5000):
+            poller._update(client, mower)  # the same state: nothing changed
+        tracked = poller._tracked[(client, "1")]
+        assert tracked.unchanged == 3  # 600 * 1.5**3 > 1800
+        assert tracked.due == poller.max_interval
+
+    @pytest.mark.asyncio
+    async def test_failing_mower_does_not_stop_the_pass(self):
+        client = FakeFleetClient(_mower("1", MOWING), _mower("2", MOWING))
+        poller = _poller(client)
+        interval = poller.interval
+
+        def broken_for_1(mower, unchanged=0):
+            if mower.id == "1":
+                raise ValueError("unexpected payload")
+            return interval(mower, unchanged)
+
+        poller.interval = broken_for_1
+        assert await poller.poll_once() == 1
+        assert set(poller.states) == {"1", "2"}
+        assert poller._tracked[(client, "1")].due == 120  # retried later
+        assert poller._tracked[(client, "2")].due == 30
+
+    @pytest.mark.asyncio
+    async def test_mowers_missing_from_the_list_are_dropped(self):
+        client = FakeFleetClient(_mower("1", CHARGING), _mower("2", CHARGING))
+        other = FakeFleetClient(_mower("3", CHARGING))
+        poller = _poller(client, other)
+        await poller.poll_once()
+        del client.fleet[1]
+        poller._clock.now = 600  # both of client's mowers due: one list request
+        await poller.poll_once()
+        assert set(poller.states) == {"1", "3"}
+
+    @pytest.mark.asyncio
+    async def test_budget_and_concurrency_cap(self):
+        gauge = {"now": 0, "max": 0}
+        clients = [
+            FakeFleetClient(_mower(str(i), MOWING), gauge=gauge) for i in range(4)
+        ]
+        poller = _poller(*clients, budget=3, budget_window=60, max_concurrency=2)
+        assert await poller.poll_once() == 3
+        assert gauge["max"] == 2
+        assert await poller.poll_once() == 0  # budget used up
+        poller._clock.now = 60
+        assert await poller.poll_once() == 3  # new window: the rest + 2 due
+        assert len(poller.states) == 4
+
+    @pytest.mark.asyncio
+    async def test_run_sleeps_until_next_due_and_stops(self):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 2:
+                raise asyncio.CancelledError
+
+        poller = _poller(FakeFleetClient(_mower("1", CHARGING)), sleep=fake_sleep)
+        with pytest.raises(asyncio.CancelledError):
+            await poller.run()
+        assert sleeps == [600, 600]
+
+
+# --------------------------------------------------------------------------- #
+# watch()
+# --------------------------------------------------------------------------- #
+class TestWatch:
+    @pytest.mark.asyncio
+    async def test_slot_keeps_only_the_latest_merged_changes(self):
+        slot = WatchSlot()
+        slot.offer(frozenset({"status"}))
+        slot.offer(frozenset({"name"}))
+        assert await slot.next() == {"status", "name"}
+        slot.offer(frozenset({"id"}))
+        assert await slot.next() == {"id"}
+        slot.close()
+        assert await slot.next() is None
+
+    @pytest.mark.asyncio
+    async def test_close_ends_every_watch(self):
+        api = _make_api(pacer=RequestPacer(mower_gap=0))
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{IMOW_API_URI}/mowers/31466/", payload=MOWER_PAYLOAD, repeat=True
+            )
+            seen = []
+
+            async def consume():
+                async for state in api.watch("31466", interval=60):
+                    seen.append(state)
+
+            watchers = [asyncio.ensure_future(consume()) for _ in range(2)]
+            while len(seen) < 2:
+                await asyncio.sleep(0.01)
+            await api.close()
+            await asyncio.wait_for(asyncio.gather(*watchers), 1)
+        assert api._watch_hubs == {}
+
+    @pytest.mark.asyncio
+    async def test_watchers_share_one_poll_and_see_only_changes(self):
+        api = _make_api(pacer=RequestPacer(mower_gap=0))
+        url = f"{IMOW_API_URI}/mowers/31466/"
+        moved = dict(MOWER_PAYLOAD, coordinateLatitude=1.0)
+        with aioresponses() as mocked:
+            mocked.get(url, payload=MOWER_PAYLOAD)
+            mocked.get(url, payload=MOWER_PAYLOAD)
+            mocked.get(url, payload=moved, repeat=True)
+            first = api.watch("31466", interval=0.01, changes=True)
+            second = api.watch("31466", interval=1)
+            async with contextlib.aclosing(first), contextlib.aclosing(second):
+                state, changed = await anext(first)
+                assert "status.mainState" in changed
+                assert await anext(second) is state  # current state first
+                state, changed = await anext(first)
+                assert changed == {"coordinateLatitude"}
+                assert await anext(second) is state
+                assert state.coordinateLatitude == 1.0
+                polls = sum(len(c) for c in mocked.requests.values())
+                assert polls >= 3  # the unchanged second poll yielded nothing
+                assert len(api._watch_hubs) == 1
+        assert api._watch_hubs == {}  # last watcher left: poll stopped
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_mower_watch_updates_the_instance_and_cancels(self):
+        api = _make_api(pacer=RequestPacer(mower_gap=0))
+        mower = MowerState(MOWER_PAYLOAD, api)
+        moved = dict(MOWER_PAYLOAD, coordinateLatitude=2.0)
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/31466/", payload=moved, repeat=True)
+            seen = []
+
+            async def consume():
+                async for state in mower.watch(interval=0.01):
+                    seen.append(state.coordinateLatitude)
+
+            task = asyncio.ensure_future(consume())
+            while len(seen) < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await api.close()  # a poll may still be in flight: let it drain
+        assert seen[:2] == [54.1, 2.0] and mower.coordinateLatitude == 2.0
+        assert api._watch_hubs == {}
+
+
+# --------------------------------------------------------------------------- #
+# receive_many()
+# --------------------------------------------------------------------------- #
+class TestReceiveMany:
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order_with_partial_failures(self):
+        api = _make_api(pacer=RequestPacer(mower_gap=0))
+        with aioresponses() as mocked:
+            for mower_id in ("1", "2"):
+                mocked.get(
+                    f"{IMOW_API_URI}/mowers/{mower_id}/",
+                    payload=dict(MOWER_PAYLOAD, id=mower_id),
+                )
+            mocked.get(f"{IMOW_API_URI}/mowers/1/statistic/", payload={"s": 1})
+            mocked.get(f"{IMOW_API_URI}/mowers/2/statistic/", status=404)
+            results = [
+                result
+                async for result in api.receive_many(
+                    [1, "2", "1"], include={"state", "statistics"}
+                )
+            ]
+        by_id = {result.mower_id: result for result in results}
+        assert sorted(by_id) == ["1", "2"]  # duplicates are read once
+        assert by_id["1"].ok and by_id["1"].statistics == {"s": 1}
+        assert by_id["2"].state.id == "2" and by_id["2"].statistics is None
+        assert isinstance(by_id["2"].errors["statistics"], aiohttp.ClientResponseError)
+        assert by_id["1"].start_points is None  # not requested
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_early_results(self, monkeypatch):
+        gauge = {"now": 0, "max": 0}
+
+        async def slow(request):
+            gauge["now"] += 1
+            gauge["max"] = max(gauge["max"], gauge["now"])
+            await asyncio.sleep(0.05 if request.match_info["id"] == "0" else 0.01)
+            gauge["now"] -= 1
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/mowers/{id}/statistic/", slow)
+        app.router.add_get("/mowers/{id}/start-points/", slow)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(
+                "imow.api.IMOW_API_URI", str(server.make_url("")).rstrip("/")
+            )
+            api = _make_api(pacer=RequestPacer(rate=0, mower_gap=0))
+            order = [
+                result.mower_id
+                async for result in api.receive_many(
+                    [str(i) for i in range(6)],
+                    include=["statistics", "start_points"],
+                    concurrency=3,
+                )
+            ]
+            await api.close()
+        assert gauge["max"] == 3
+        assert order[0] != "0" and sorted(order) == [str(i) for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_paced_reads_do_not_hold_slots(self):
+        # Old behaviour: each mower's second read slept 0.2s inside a slot,
+        # so with two slots the three mowers took ~0.4s.
+        api = _make_api(pacer=RequestPacer(rate=0, mower_gap=0.2))
+        with aioresponses() as mocked:
+            for mower_id in ("1", "2", "3"):
+                mocked.get(f"{IMOW_API_URI}/mowers/{mower_id}/statistic/", payload={})
+                mocked.get(
+                    f"{IMOW_API_URI}/mowers/{mower_id}/start-points/", payload=[]
+                )
+            started = time.monotonic()
+            results = [
+                result
+                async for result in api.receive_many(
+                    ["1", "2", "3"],
+                    include=["statistics", "start_points"],
+                    concurrency=2,
+                )
+            ]
+            elapsed = time.monotonic() - started
+        assert len(results) == 3 and all(result.ok for result in results)
+        assert elapsed < 0.35
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_include_and_early_exit(self):
+        api = _make_api()
+        with pytest.raises(ValueError, match="bogus"):
+            async for _ in api.receive_many(["1"], include={"bogus"}):
+                pass
+        with pytest.raises(ValueError, match="concurrency"):
+            async for _ in api.receive_many(["1"], concurrency=0):
+                pass
+
+        cancelled = []
+
+        async def read(mower_id):
+            if mower_id == "1":
+                return {}
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(mower_id)
+                raise
+
+        api.receive_mower_statistics = read
+        results = api.receive_many(["1", "2"], include=["statistics"])
+        assert (await anext(results)).mower_id == "1"
+        await results.aclose()
+        assert cancelled == ["2"]  # the remaining read was cancelled
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_slots_do_not_outlive_the_reads(self):
+        api = _make_api(email="a@b.c", password="pw")
+        api.token_expires = _utcnow() + timedelta(days=30)
+        seen = {}
+        blocked = asyncio.Event()
+
+        async def refresh_loop():
+            seen["refresher"] = _request_slots.get()
+
+        async def read(mower_id):
+            seen[mower_id] = _request_slots.get()
+            if mower_id == "1":
+                api.start_token_refresher()  # as the first request would
+                return {}
+            blocked.set()
+            await asyncio.sleep(10)
+
+        api._token_refresh_loop = refresh_loop
+        api.receive_mower_statistics = read
+        results = api.receive_many(["1", "2"], include=["statistics"])
+        assert (await anext(results)).mower_id == "1"
+        await blocked.wait()
+        await results.aclose()  # stops while the read of "2" is blocked
+        await api._token_refresh_task
+        assert isinstance(seen["1"], asyncio.Semaphore) and seen["2"] is seen["1"]
+        assert seen["refresher"] is None
+        assert _request_slots.get() is None
+        await api.close()
+
+
+# --------------------------------------------------------------------------- #
+# Multi-account client pool
+# --------------------------------------------------------------------------- #
+class TestClientPool:
+    @pytest.mark.asyncio
+    async def test_accounts_share_connector_not_cookies(self):
+        async with IMowClientPool(limit_per_host=5) as pool:
+            alice = pool.add_account("alice", token=FAKE_TOKEN)
+            bob = pool.add_account("bob", token=FAKE_TOKEN)
+            with pytest.raises(ValueError, match="alice"):
+                pool.add_account("alice")
+            assert pool.get("bob") is bob and "alice" in pool and len(pool) == 2
+            assert alice.http_session.connector is bob.http_session.connector
+            assert pool.connector.limit_per_host == 5
+            assert alice._auth_lock is not bob._auth_lock
+            assert alice.pacer is bob.pacer is pool.pacer
+            own = RequestPacer()
+            assert pool.add_account("carol", token=FAKE_TOKEN, pacer=own).pacer is own
+            await pool.remove_account("carol")
+
+            cookie = SimpleCookie("session=abc")
+            cookie["session"]["domain"] = IMOW_COOKIE_HOSTS[0]
+            for api in (alice, bob):
+                api.http_session.cookie_jar.update_cookies(cookie)
+            alice._clear_stihl_cookies()
+            assert len(alice.http_session.cookie_jar) == 0
+            assert len(bob.http_session.cookie_jar) == 1
+
+            connector = pool.connector
+            session = alice.http_session
+            await pool.remove_account("alice")
+            assert session.closed and not connector.closed
+            assert "alice" not in pool
+        assert bob.http_session.closed and connector.closed and len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_per_account_caches_are_never_shared(self):
+        with pytest.raises(ValueError, match="response_cache_factory"):
+            IMowClientPool(response_cache=ResponseCache())
+        async with IMowClientPool(
+            response_cache_factory=ResponseCache,
+            validator_cache_factory=ValidatorCache,
+        ) as pool:
+            alice = pool.add_account("alice", token=FAKE_TOKEN)
+            bob = pool.add_account("bob", token=FAKE_TOKEN)
+            assert isinstance(alice.response_cache, ResponseCache)
+            assert alice.response_cache is not bob.response_cache
+            assert alice.validator_cache is not bob.validator_cache
+            assert alice.payload_digests is None
+
+    @pytest.mark.asyncio
+    async def test_metrics_per_account(self):
+        pool = IMowClientPool(pacer=RequestPacer(mower_gap=0))
+        for key in ("ok", "broken"):
+            api = pool.add_account(key, token=FAKE_TOKEN)
+            api.messages_en = api.messages_user = _i18n_messages()
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_API_URI}/mowers/", payload=[], repeat=True)
+            mocked.get(f"{IMOW_API_URI}/mowers/1/", status=404)
+            await pool.get("ok").receive_mowers()
+            with pytest.raises(aiohttp.ClientResponseError):
+                await pool.get("broken").receive_mower_by_id("1")
+        metrics = pool.metrics()
+        assert metrics["ok"]["requests"] == 1 and metrics["ok"]["errors"] == 0
+        assert metrics["broken"]["requests"] == 1 and metrics["broken"]["errors"] == 1
+        assert pool.stats() == {"accounts": 2, "requests": 2, "errors": 1}
+        await pool.close()
+
+
+# --------------------------------------------------------------------------- #
+# Connector settings and connection warm-up
+# --------------------------------------------------------------------------- #
+class TestConnections:
+    @pytest.mark.asyncio
+    async def test_owned_session_uses_tuned_connector(self):
+        api = _make_api(limit_per_host=3, ttl_dns_cache=60, keepalive_timeout=5)
+        connector = api._ensure_session().connector
+        assert connector.limit_per_host == 3
+        assert connector._keepalive_timeout == 5
+        await api.close()
+        assert connector.closed
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_and_ignores_failures(self):
+        heads = []
+
+        async def head(request):
+            heads.append(request.path)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_route("HEAD", "/", head)
+        async with TestServer(app) as server:
+            api = _make_api()
+            answered = await api.warm_up(
+                [str(server.make_url("/")), "http://127.0.0.1:1/"], timeout=2
+            )
+            await api.close()
+        assert answered == 1 and heads == ["/"]
+
+    @pytest.mark.asyncio
+    async def test_warm_up_default_hosts(self):
+        api = IMowApi(email="user@example.com", password="secret")
+        with aioresponses() as mocked:
+            for uri in (IMOW_API_URI, IMOW_APP_URI, IMOW_OAUTH_URI):
+                mocked.head(uri, status=404)
+            assert await api.warm_up() == 3
+            assert len(mocked.requests) == 3
+        warm = _make_api()
+        with aioresponses() as mocked:
+            mocked.head(IMOW_API_URI)
+            assert await warm.warm_up() == 1
+            assert list(mocked.requests) == [("HEAD", URL(IMOW_API_URI))]
+        await api.close()
+        await warm.close()
+
+
+# --------------------------------------------------------------------------- #
+# Startup pipeline and graceful close
+# --------------------------------------------------------------------------- #
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_start_runs_setup_concurrently_then_fetches_fleet(self):
+        api = IMowApi(email="user@example.com", password="secret")
+        events = []
+
+        def step(name, effect=None):
+            async def run(*args, **kwargs):
+                events.append(f"{name} started")
+                await asyncio.sleep(0.02)
+                if effect:
+                    effect()
+                events.append(f"{name} done")
+
+            return run
+
+        api.fetch_messages = step("i18n")
+        api.get_token = step("token", lambda: setattr(api, "access_token", "t"))
+        api.warm_up = step("warm-up")
+
+        async def receive_mowers():
+            events.append(f"fleet with token {api.access_token}")
+            return ["mower"]
+
+        api.receive_mowers = receive_mowers
+        async with api as started:
+            assert started is api
+        assert events[:3] == ["i18n started", "warm-up started", "token started"]
+        assert events[-1] == "fleet with token t"
+        assert api.time_to_first_state >= 0.02
+        assert api.stats()["time_to_first_state"] == api.time_to_first_state
+
+    @pytest.mark.asyncio
+    async def test_failed_start_closes_and_stops_setup(self):
+        api = IMowApi(token=FAKE_TOKEN, i18n_registry=MessagesRegistry())
+        cancelled = []
+
+        async def slow_warm_up(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("warm-up")
+                raise
+
+        api.warm_up = slow_warm_up
+        with aioresponses() as mocked:
+            mocked.get(f"{IMOW_I18N_BASE_URI}/en.json", status=500)
+            with pytest.raises(aiohttp.ClientResponseError):
+                async with api:
+                    pass
+        assert cancelled == ["warm-up"]
+        assert api.http_session.closed
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated_requests_skip_i18n(self):
+        api = IMowApi()
+        with aioresponses() as mocked:
+            mocked.get(IMOW_MAINTENANCE_URI, payload={})
+            await api.api_request(IMOW_MAINTENANCE_URI, "GET", authenticated=False)
+        assert api.messages_en is None
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_in_flight_requests(self, caplog):
+        arrived, release = asyncio.Event(), asyncio.Event()
+
+        async def slow(request):
+            arrived.set()
+            await release.wait()
+            return web.json_response([])
+
+        app = web.Application()
+        app.router.add_route("*", "/slow", slow)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/slow"))
+            api = _make_api()
+            request = asyncio.ensure_future(api.api_request(url, "GET"))
+            await arrived.wait()
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            await api.close()
+            assert request.done() and (await request).status == 200
+            assert api.stats()["in_flight"] == 0
+
+            arrived.clear()
+            release.clear()
+            api = _make_api()
+            # A POST is not retried once the closed session drops it.
+            request = asyncio.ensure_future(api.api_request(url, "POST"))
+            await arrived.wait()
+            await api.close(drain_timeout=0.05)
+            assert "still in flight" in caplog.text
+            release.set()
+            with pytest.raises(aiohttp.ClientError):
+                await request
+
+    @pytest.mark.asyncio
+    async def test_new_requests_are_rejected_while_draining(self):
+        arrived, release = asyncio.Event(), asyncio.Event()
+
+        async def slow(request):
+            arrived.set()
+            await release.wait()
+            return web.json_response([])
+
+        app = web.Application()
+        app.router.add_get("/mowers/", slow)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/mowers/"))
+            api = _make_api()
+            request = asyncio.ensure_future(api.api_request(url, "GET"))
+            await arrived.wait()
+            closing = asyncio.ensure_future(api.close())
+            await asyncio.sleep(0)
+            with pytest.raises(ClientClosingError):
+                await api.api_request(url, "GET")
+            release.set()
+            await closing
+            assert (await request).status == 200
+            assert api.stats()["requests"] == 1 and not api._closing
+
+
 # --------------------------------------------------------------------------- #
 # Helpers for the tests above
 # --------------------------------------------------------------------------- #